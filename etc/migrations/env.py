@@ -34,6 +34,11 @@ target_metadata = Base.metadata
 config.set_main_option("sqlalchemy.url", database_config.database_url_asyncpg)
 
 
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    # Views are mapped for reading only and managed by hand-written migrations.
+    return not (type_ == "table" and object.info.get("is_view", False))
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -50,6 +55,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -59,7 +65,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,31 @@
+"""reception point keyset index
+
+Revision ID: 3f1c2a7d9b10
+Revises: 5a09fb2c83e2
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a7d9b10"
+down_revision: Union[str, None] = "5a09fb2c83e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_Reception_Point_updated_at_id",
+        "Reception_Point",
+        ["updated_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_Reception_Point_updated_at_id", table_name="Reception_Point")
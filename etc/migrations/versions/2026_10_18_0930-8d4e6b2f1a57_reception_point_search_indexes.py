@@ -0,0 +1,65 @@
+"""reception point search indexes
+
+Revision ID: 8d4e6b2f1a57
+Revises: 3f1c2a7d9b10
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4e6b2f1a57"
+down_revision: Union[str, None] = "3f1c2a7d9b10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "Reception_Point",
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute('UPDATE "Reception_Point" SET created_at = updated_at')
+    op.alter_column(
+        "Reception_Point",
+        "created_at",
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+    op.create_index(
+        "ix_Reception_Point_created_at",
+        "Reception_Point",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_Reception_Point_name_trgm",
+        "Reception_Point",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_Reception_Point_address_trgm",
+        "Reception_Point",
+        ["address"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"address": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_Reception_Point_address_trgm", table_name="Reception_Point")
+    op.drop_index("ix_Reception_Point_name_trgm", table_name="Reception_Point")
+    op.drop_index("ix_Reception_Point_created_at", table_name="Reception_Point")
+    op.drop_column("Reception_Point", "created_at")
@@ -0,0 +1,41 @@
+"""reception point location
+
+Revision ID: b71e0c93d4a2
+Revises: 8d4e6b2f1a57
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b71e0c93d4a2"
+down_revision: Union[str, None] = "8d4e6b2f1a57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS cube")
+    op.execute("CREATE EXTENSION IF NOT EXISTS earthdistance")
+
+    op.add_column("Reception_Point", sa.Column("latitude", sa.Float(), nullable=True))
+    op.add_column("Reception_Point", sa.Column("longitude", sa.Float(), nullable=True))
+
+    op.create_index(
+        "ix_Reception_Point_location",
+        "Reception_Point",
+        [sa.text("ll_to_earth(latitude, longitude)")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_Reception_Point_location", table_name="Reception_Point")
+    op.drop_column("Reception_Point", "longitude")
+    op.drop_column("Reception_Point", "latitude")
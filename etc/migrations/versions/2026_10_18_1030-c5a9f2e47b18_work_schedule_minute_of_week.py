@@ -0,0 +1,76 @@
+"""work schedule minute of week
+
+Revision ID: c5a9f2e47b18
+Revises: b71e0c93d4a2
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5a9f2e47b18"
+down_revision: Union[str, None] = "b71e0c93d4a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "Work_Schedule",
+        sa.Column("open_minute_of_week", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "Work_Schedule",
+        sa.Column("close_minute_of_week", sa.Integer(), nullable=True),
+    )
+
+    # Backfill existing rows the same way WorkSchedule.update_minute_of_week does.
+    op.execute(
+        """
+        UPDATE "Work_Schedule"
+        SET open_minute_of_week = day_start + open_minute,
+            close_minute_of_week = day_start + close_minute
+                + CASE WHEN close_minute <= open_minute THEN 1440 ELSE 0 END
+        FROM (
+            SELECT
+                id AS schedule_id,
+                (array_position(
+                    ARRAY['MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY',
+                          'FRIDAY', 'SATURDAY', 'SUNDAY'],
+                    dayofweek::text
+                ) - 1) * 1440 AS day_start,
+                (EXTRACT(HOUR FROM open_time) * 60
+                    + EXTRACT(MINUTE FROM open_time))::integer AS open_minute,
+                (EXTRACT(HOUR FROM close_time) * 60
+                    + EXTRACT(MINUTE FROM close_time))::integer AS close_minute
+            FROM "Work_Schedule"
+            WHERE open_time IS NOT NULL AND close_time IS NOT NULL
+        ) AS minutes
+        WHERE id = minutes.schedule_id
+        """
+    )
+
+    op.create_index(
+        "ix_Work_Schedule_minute_of_week",
+        "Work_Schedule",
+        ["open_minute_of_week", "close_minute_of_week"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_Work_Schedule_reception_point_id",
+        "Work_Schedule",
+        ["reception_point_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_Work_Schedule_reception_point_id", table_name="Work_Schedule")
+    op.drop_index("ix_Work_Schedule_minute_of_week", table_name="Work_Schedule")
+    op.drop_column("Work_Schedule", "close_minute_of_week")
+    op.drop_column("Work_Schedule", "open_minute_of_week")
@@ -0,0 +1,48 @@
+"""user points total
+
+Revision ID: e8b3c6d05f21
+Revises: d2f7a8c31e64
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b3c6d05f21"
+down_revision: Union[str, None] = "d2f7a8c31e64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "User",
+        sa.Column(
+            "points_total",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+
+    op.execute(
+        """
+        UPDATE "User"
+        SET points_total = totals.total
+        FROM (
+            SELECT user_id, SUM(points) AS total
+            FROM "Accrual_History"
+            GROUP BY user_id
+        ) AS totals
+        WHERE "User".id = totals.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("User", "points_total")
@@ -0,0 +1,33 @@
+"""accrual history user keyset index
+
+Revision ID: f4a1d7e92c38
+Revises: e8b3c6d05f21
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a1d7e92c38"
+down_revision: Union[str, None] = "e8b3c6d05f21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_Accrual_History_user_id_created_at_id",
+        "Accrual_History",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_Accrual_History_user_id_created_at_id", table_name="Accrual_History"
+    )
@@ -0,0 +1,75 @@
+"""leaderboard
+
+Revision ID: a9c3e5b17d42
+Revises: f4a1d7e92c38
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e5b17d42"
+down_revision: Union[str, None] = "f4a1d7e92c38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_Accrual_History_created_at",
+        "Accrual_History",
+        ["created_at"],
+        unique=False,
+    )
+
+    # Period values are the names of enums.LeaderboardPeriod. Users without
+    # points in a period are left out.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW "Leaderboard" AS
+        SELECT
+            period,
+            user_id,
+            points,
+            RANK() OVER (PARTITION BY period ORDER BY points DESC) AS rank
+        FROM (
+            SELECT 'ALL' AS period, id AS user_id, points_total AS points
+            FROM "User"
+            WHERE points_total > 0
+            UNION ALL
+            SELECT 'WEEK', user_id, SUM(points)
+            FROM "Accrual_History"
+            WHERE created_at >= date_trunc('week', now())
+            GROUP BY user_id
+            HAVING SUM(points) > 0
+            UNION ALL
+            SELECT 'MONTH', user_id, SUM(points)
+            FROM "Accrual_History"
+            WHERE created_at >= date_trunc('month', now())
+            GROUP BY user_id
+            HAVING SUM(points) > 0
+        ) AS totals
+        """
+    )
+    # The unique index serves rank lookups and REFRESH ... CONCURRENTLY.
+    op.create_index(
+        "ix_Leaderboard_period_user_id",
+        "Leaderboard",
+        ["period", "user_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_Leaderboard_period_rank_user_id",
+        "Leaderboard",
+        ["period", "rank", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW "Leaderboard"')
+    op.drop_index("ix_Accrual_History_created_at", table_name="Accrual_History")
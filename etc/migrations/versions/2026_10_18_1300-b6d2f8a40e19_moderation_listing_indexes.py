@@ -0,0 +1,58 @@
+"""moderation listing indexes
+
+Revision ID: b6d2f8a40e19
+Revises: a9c3e5b17d42
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d2f8a40e19"
+down_revision: Union[str, None] = "a9c3e5b17d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_Moderation_verification_date_id",
+        "Moderation",
+        ["verification_date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_Moderation_reception_point_id_verification_date",
+        "Moderation",
+        ["reception_point_id", "verification_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_Moderation_user_id_verification_date",
+        "Moderation",
+        ["user_id", "verification_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_Reception_Point_pending_created_at_id",
+        "Reception_Point",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'UNDER_MODERATION'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_Reception_Point_pending_created_at_id", table_name="Reception_Point"
+    )
+    op.drop_index("ix_Moderation_user_id_verification_date", table_name="Moderation")
+    op.drop_index(
+        "ix_Moderation_reception_point_id_verification_date", table_name="Moderation"
+    )
+    op.drop_index("ix_Moderation_verification_date_id", table_name="Moderation")
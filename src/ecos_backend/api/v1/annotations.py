@@ -10,6 +10,9 @@ from ecos_backend.api.v1.schemas import moderation
 from ecos_backend.api.v1.schemas import reception_point
 from ecos_backend.api.v1.schemas import waste
 
+from ecos_backend.common.cache import Cache
+from ecos_backend.service.accrual_history import AccrualHistoryService
+from ecos_backend.service.leaderboard import LeaderboardService
 from ecos_backend.service.moderation import ModerationService
 from ecos_backend.service.user import UserService
 from ecos_backend.service.reception_point import ReceptionPointService
@@ -26,6 +29,10 @@ search_filter = typing.Annotated[typing.Optional[str], Query(alias="filter")]
 
 user_service = typing.Annotated[UserService, Depends(dependencies.get_user_service)]
 
+accrual_history_service = typing.Annotated[
+    AccrualHistoryService, Depends(dependencies.get_accrual_history_service)
+]
+
 reception_point_service = typing.Annotated[
     ReceptionPointService, Depends(dependencies.get_reception_point_service)
 ]
@@ -35,14 +42,20 @@ moderation_service = typing.Annotated[
     ModerationService, Depends(dependencies.get_moderation_service)
 ]
 
+leaderboard_service = typing.Annotated[
+    LeaderboardService, Depends(dependencies.get_leaderboard_service)
+]
+
 
 data_request = typing.Annotated[
-    tuple[dict | None, list[tuple[str, bytes, str]] | None],
+    tuple[dict | None, list[tuple[str, typing.BinaryIO, str]] | None],
     Depends(dependencies.parse_request),
 ]
 
 verify_token = typing.Annotated[dict, Depends(dependencies.verify_token)]
 
+cache = typing.Annotated[Cache, Depends(dependencies.get_cache)]
+
 reception_point_by_id = typing.Annotated[
     reception_point.ReceptionPointResponseSchema,
     Depends(dependencies.reception_point_by_id),
@@ -50,3 +63,8 @@ reception_point_by_id = typing.Annotated[
 waste_by_id = typing.Annotated[
     waste.WasteResponseSchema, Depends(dependencies.waste_by_id)
 ]
+
+reception_point_etag = typing.Annotated[
+    str | None, Depends(dependencies.reception_point_etag)
+]
+waste_etag = typing.Annotated[str | None, Depends(dependencies.waste_etag)]
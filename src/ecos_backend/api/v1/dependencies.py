@@ -1,14 +1,14 @@
 import uuid
 import json
 import typing
+import hashlib
+import functools
 
 from urllib.parse import unquote
 
-from fastapi import Depends, Path, Security, Request
+from fastapi import Depends, Path, Security, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from keycloak import KeycloakAdmin
 
 from streaming_form_data import StreamingFormDataParser
@@ -24,38 +24,92 @@ from ecos_backend.common import config
 from ecos_backend.common import validation
 from ecos_backend.common import exception as custom_exceptions
 from ecos_backend.common.exception import ForbiddenExcetion, UnauthorizedExcetion
+from ecos_backend.common.cache import Cache, SingleFlight, cache_factory
+from ecos_backend.common.tasks import PeriodicTask
+from ecos_backend.common.urls import url_builder
 from ecos_backend.common.unit_of_work import SQLAlchemyUnitOfWork, AbstractUnitOfWork
 from ecos_backend.common.keycloak_adapters import (
     KeycloakAdminAdapter,
     KeycloakClientAdapter,
+    KeycloakTokenVerifier,
 )
 
 from ecos_backend.db.models.reception_point import ReceptionPoint
 from ecos_backend.db.models.waste import Waste
+from ecos_backend.service.accrual_history import AccrualHistoryService
+from ecos_backend.service.leaderboard import LeaderboardService
 from ecos_backend.service.user import UserService
 from ecos_backend.service.reception_point import ReceptionPointService
-from ecos_backend.service.waste import WasteService
+from ecos_backend.service.waste import WasteCatalog, WasteEntry, WasteService
 from ecos_backend.service.moderation import ModerationService
+from ecos_backend.service.table_version import TableVersionService
 
 MAX_FILE_SIZE = 1024 * 1024 * 10  # 10MB
 MAX_REQUEST_BODY_SIZE = 1024 * 1024 * 10 + 1024
+MAX_IN_MEMORY_FILE_SIZE = 1024 * 1024  # 1MB, larger files are spooled to disk
 
 bearer_scheme = HTTPBearer()
 
 admin_adapter = KeycloakAdminAdapter()
 client_adapter = KeycloakClientAdapter()
+token_verifier = KeycloakTokenVerifier(
+    openid=client_adapter.openid,
+    issuer=config.keycloak_config.issuer,
+    audience=config.keycloak_config.KEYCLOAK_AUDIENCE,
+    leeway=config.keycloak_config.KEYCLOAK_JWT_LEEWAY,
+    min_refresh_interval=config.keycloak_config.KEYCLOAK_JWKS_MIN_REFRESH_INTERVAL,
+    cache_size=config.keycloak_config.KEYCLOAK_TOKEN_CACHE_SIZE,
+    cache_ttl=config.keycloak_config.KEYCLOAK_TOKEN_CACHE_TTL,
+)
 database_client: database.Database = database.database_factory(
     config=config.database_config
 )
 s3_client: s3_storage.Boto3DAO = s3_storage.s3_bucket_factory(config=config.s3_config)
+for bucket_name in config.s3_config.SIGNED_BUCKETS:
+    url_builder.set_signer(bucket_name, s3_client.signer)
+cache: Cache = cache_factory(config=config.cache_config)
+single_flight: SingleFlight = SingleFlight(
+    timeout=config.cache_config.SINGLE_FLIGHT_TIMEOUT
+)
+uow_factory: typing.Callable[[], AbstractUnitOfWork] = functools.partial(
+    SQLAlchemyUnitOfWork, database_client.session_factory
+)
+waste_catalog: WasteCatalog = WasteCatalog(
+    uow_factory=uow_factory,
+    poll_interval=config.cache_config.WASTE_CATALOG_POLL_INTERVAL,
+)
 
 
-async def get_uow(
-    session: typing.Annotated[
-        AsyncSession, Depends(database_client.session_dependency)
-    ],
-) -> typing.AsyncGenerator[AbstractUnitOfWork, None]:
-    async with SQLAlchemyUnitOfWork(session) as uow:
+async def reconcile_points_totals() -> None:
+    async with SQLAlchemyUnitOfWork(database_client.session_factory) as uow:
+        await AccrualHistoryService(uow=uow, cache=cache).reconcile_points_totals()
+
+
+points_reconciliation: PeriodicTask = PeriodicTask(
+    reconcile_points_totals,
+    interval=config.jobs_config.POINTS_RECONCILIATION_INTERVAL,
+    name="points-reconciliation",
+)
+
+
+async def refresh_leaderboard() -> None:
+    async with SQLAlchemyUnitOfWork(database_client.session_factory) as uow:
+        await LeaderboardService(uow=uow, cache=cache).refresh()
+
+
+leaderboard_refresh: PeriodicTask = PeriodicTask(
+    refresh_leaderboard,
+    interval=config.jobs_config.LEADERBOARD_REFRESH_INTERVAL,
+    name="leaderboard-refresh",
+)
+
+
+def get_cache() -> Cache:
+    return cache
+
+
+async def get_uow() -> typing.AsyncGenerator[AbstractUnitOfWork, None]:
+    async with SQLAlchemyUnitOfWork(database_client.session_factory) as uow:
         yield uow
 
 
@@ -64,21 +118,34 @@ async def get_user_service(
     admin: typing.Annotated[KeycloakAdmin, Depends(admin_adapter)],
     s3: typing.Annotated[s3_storage.Boto3DAO, Depends(s3_client)],
 ) -> UserService:
-    return UserService(uow=uow, admin=admin, s3_storage=s3)
+    return UserService(uow=uow, admin=admin, s3_storage=s3, cache=cache)
+
+
+async def get_accrual_history_service(
+    uow: typing.Annotated[AbstractUnitOfWork, Depends(get_uow)],
+) -> AccrualHistoryService:
+    return AccrualHistoryService(uow=uow, cache=cache)
 
 
 async def get_reception_point_service(
     uow: typing.Annotated[AbstractUnitOfWork, Depends(get_uow)],
     s3: typing.Annotated[s3_storage.Boto3DAO, Depends(s3_client)],
 ) -> UserService:
-    return ReceptionPointService(uow=uow, s3_storage=s3)
+    return ReceptionPointService(uow=uow, s3_storage=s3, cache=cache)
 
 
 async def get_waste_service(
     uow: typing.Annotated[AbstractUnitOfWork, Depends(get_uow)],
     s3: typing.Annotated[s3_storage.Boto3DAO, Depends(s3_client)],
 ) -> UserService:
-    return WasteService(uow=uow, s3_storage=s3)
+    return WasteService(
+        uow=uow,
+        s3_storage=s3,
+        catalog=waste_catalog,
+        cache=cache,
+        single_flight=single_flight,
+        uow_factory=uow_factory,
+    )
 
 
 async def get_moderation_service(
@@ -87,6 +154,18 @@ async def get_moderation_service(
     return ModerationService(uow=uow)
 
 
+async def get_leaderboard_service(
+    uow: typing.Annotated[AbstractUnitOfWork, Depends(get_uow)],
+) -> LeaderboardService:
+    return LeaderboardService(uow=uow, cache=cache)
+
+
+async def get_table_version_service(
+    uow: typing.Annotated[AbstractUnitOfWork, Depends(get_uow)],
+) -> TableVersionService:
+    return TableVersionService(uow=uow)
+
+
 async def verify_token(
     credentials: typing.Annotated[
         HTTPAuthorizationCredentials, Security(bearer_scheme)
@@ -94,7 +173,10 @@ async def verify_token(
 ):
     token: str = credentials.credentials
     try:
-        user_info = await client_adapter.openid.a_userinfo(token)
+        if config.keycloak_config.KEYCLOAK_LOCAL_VERIFY:
+            user_info = await token_verifier.verify(token)
+        else:
+            user_info = await client_adapter.openid.a_userinfo(token)
         if not user_info or "sub" not in user_info:
             raise UnauthorizedExcetion(detail="Invalid token")
         return user_info
@@ -105,7 +187,9 @@ async def verify_token(
 
 async def parse_request(
     request: Request,
-) -> tuple[dict | None, list[tuple[str, bytes, str]] | None]:
+) -> typing.AsyncGenerator[
+    tuple[dict | None, list[tuple[str, typing.BinaryIO, str]] | None], None
+]:
     body_validator = validation.MaxBodySizeValidator(MAX_REQUEST_BODY_SIZE)
     data = ValueTarget()
     parser = StreamingFormDataParser(headers=request.headers)
@@ -120,65 +204,83 @@ async def parse_request(
     )
 
     for filename in filenames:
-        file_target = validation.BytesTarget(
-            validator=validation.MaxSizeValidator(MAX_FILE_SIZE)
+        file_target = validation.SpooledFileTarget(
+            validator=validation.MaxSizeValidator(MAX_FILE_SIZE),
+            max_memory_size=MAX_IN_MEMORY_FILE_SIZE,
         )
         parser.register(filename, file_target)
         file_targets[filename] = file_target
 
     parser.register("data", data)
 
-    async for chunk in request.stream():
-        body_validator(chunk)
-        parser.data_received(chunk)
-
     try:
-        raw_data: str | None = data.value.decode() if data.value else None
-        if raw_data and raw_data.startswith('"') and raw_data.endswith('"'):
-            raw_data = raw_data[1:-1].replace('\\"', '"')
-        data_dict: dict | None = json.loads(raw_data) if raw_data else None
-    except json.JSONDecodeError as e:
-        raise custom_exceptions.ValidationException(
-            detail=f"Invalid JSON format: {str(e)}"
-        )
-
-    uploaded_files: list = []
-    for filename, file_target in file_targets.items():
-        if file_target.content:
-            try:
-                file_extension: str = validation.FileTypeValidator.validate(
-                    file_target.content
-                ).lstrip(".")
-                uploaded_files.append((filename, file_target.content, file_extension))
-            except validation.InvalidFileTypeException as e:
-                raise custom_exceptions.ValidationException(detail=str(e))
-
-    return data_dict, uploaded_files
+        async for chunk in request.stream():
+            body_validator(chunk)
+            parser.data_received(chunk)
+
+        try:
+            raw_data: str | None = data.value.decode() if data.value else None
+            if raw_data and raw_data.startswith('"') and raw_data.endswith('"'):
+                raw_data = raw_data[1:-1].replace('\\"', '"')
+            data_dict: dict | None = json.loads(raw_data) if raw_data else None
+        except json.JSONDecodeError as e:
+            raise custom_exceptions.ValidationException(
+                detail=f"Invalid JSON format: {str(e)}"
+            )
+
+        uploaded_files: list = []
+        for filename, file_target in file_targets.items():
+            if file_target.size:
+                try:
+                    file_extension: str = validation.FileTypeValidator.validate(
+                        file_target.header
+                    ).lstrip(".")
+                    uploaded_files.append((filename, file_target.file, file_extension))
+                except validation.InvalidFileTypeException as e:
+                    raise custom_exceptions.ValidationException(detail=str(e))
+
+        yield data_dict, uploaded_files
+    finally:
+        for file_target in file_targets.values():
+            file_target.close()
 
 
 async def reception_point_by_id(
     reception_point_id: typing.Annotated[uuid.UUID, Path],
-    reception_point_service: typing.Annotated[
-        ReceptionPointService, Depends(get_reception_point_service)
-    ],
 ) -> ReceptionPointResponseSchema:
-    reception_point: (
-        ReceptionPoint | None
-    ) = await reception_point_service.get_reception_point_by_id(reception_point_id)
-
-    if reception_point is None:
-        raise custom_exceptions.NotFoundException(
-            detail=f"Reception point with {reception_point_id} id not found."
+    async def load() -> dict:
+        # The shared load can outlive the request that started it, so it
+        # opens its own session.
+        async with uow_factory() as uow:
+            reception_point: ReceptionPoint | None = await ReceptionPointService(
+                uow=uow, s3_storage=s3_client, cache=cache
+            ).get_reception_point_by_id(reception_point_id)
+
+        if reception_point is None:
+            raise custom_exceptions.NotFoundException(
+                detail=f"Reception point with {reception_point_id} id not found."
+            )
+
+        return ReceptionPointResponseSchema.model_validate(reception_point).model_dump(
+            mode="json"
         )
 
-    return reception_point
+    cache_key: str = ReceptionPointService.cache_key(reception_point_id)
+    try:
+        return await cache.get_or_set(
+            cache_key, load, tags=[cache_key, WasteService.CACHE_TAG]
+        )
+    except TimeoutError as e:
+        raise custom_exceptions.ServiceUnavailableException(
+            detail="Timed out waiting for reception point"
+        ) from e
 
 
 async def waste_by_id(
     waste_id: typing.Annotated[uuid.UUID, Path],
     waste_service: typing.Annotated[WasteService, Depends(get_waste_service)],
 ) -> WasteResponseSchema:
-    waste: Waste | None = await waste_service.get_waste_by_id(waste_id)
+    waste: WasteEntry | None = await waste_service.get_waste_by_id(waste_id)
 
     if waste is None:
         raise custom_exceptions.NotFoundException(
@@ -186,3 +288,108 @@ async def waste_by_id(
         )
 
     return waste
+
+
+class ConditionalGet:
+    """Answers conditional GETs from the versions of the tables a view reads.
+
+    The ETag hashes the table versions with the request URL and API version,
+    so it changes whenever a service write path bumps one of the tables.
+    A matching If-None-Match ends the request with 304 before the view
+    queries anything.
+
+    Responses that also depend on the clock are not validated: those with
+    any of time_params in the query, and all of them when one of buckets
+    is served through presigned URLs, which expire on their own.
+    """
+
+    def __init__(
+        self,
+        *tables: str,
+        max_age: int = 0,
+        buckets: typing.Collection[str] = (),
+        time_params: typing.Collection[str] = (),
+    ) -> None:
+        self._tables: list[str] = list(tables)
+        self._cache_control: str = (
+            f"public, max-age={max_age}" if max_age > 0 else "no-cache"
+        )
+        self._enabled: bool = not set(buckets) & set(config.s3_config.SIGNED_BUCKETS)
+        self._time_params: tuple[str, ...] = tuple(time_params)
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        table_version_service: typing.Annotated[
+            TableVersionService, Depends(get_table_version_service)
+        ],
+    ) -> str | None:
+        if not self._applies(request):
+            response.headers["Cache-Control"] = "no-cache"
+            return None
+
+        versions: dict[str, int] = await self._get_versions(table_version_service)
+        etag: str = self._etag(request, versions)
+        headers: dict[str, str] = {"ETag": etag, "Cache-Control": self._cache_control}
+
+        if self._matches(request.headers.get("if-none-match"), etag):
+            raise custom_exceptions.NotModifiedException(headers=headers)
+
+        response.headers.update(headers)
+        return etag
+
+    async def _get_versions(
+        self, table_version_service: TableVersionService
+    ) -> dict[str, int]:
+        return await table_version_service.get_versions(self._tables)
+
+    def _applies(self, request: Request) -> bool:
+        return self._enabled and not any(
+            param in request.query_params for param in self._time_params
+        )
+
+    @staticmethod
+    def _etag(request: Request, versions: dict[str, int]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(config.fastAPI_config.API_VERSION.encode())
+        digest.update(str(request.url.path).encode())
+        digest.update(str(request.url.query).encode())
+        for name in sorted(versions):
+            digest.update(f"{name}={versions[name]};".encode())
+        return f'"{digest.hexdigest()}"'
+
+    @staticmethod
+    def _matches(if_none_match: str | None, etag: str) -> bool:
+        if not if_none_match:
+            return False
+        candidates: list[str] = [
+            candidate.strip().removeprefix("W/")
+            for candidate in if_none_match.split(",")
+        ]
+        return "*" in candidates or etag in candidates
+
+
+class WasteCatalogConditionalGet(ConditionalGet):
+    """Takes the Waste version from the in-memory catalog, without a query."""
+
+    def __init__(self, catalog: WasteCatalog, max_age: int = 0) -> None:
+        super().__init__(Waste.__tablename__, max_age=max_age)
+        self._catalog: WasteCatalog = catalog
+
+    async def _get_versions(
+        self, table_version_service: TableVersionService
+    ) -> dict[str, int]:
+        return {Waste.__tablename__: await self._catalog.get_version()}
+
+
+reception_point_etag = ConditionalGet(
+    ReceptionPoint.__tablename__,
+    Waste.__tablename__,
+    max_age=config.cache_config.HTTP_CACHE_MAX_AGE,
+    buckets=[config.s3_config.RECEPTION_POINT_BUCKET],
+    time_params=["open_now"],
+)
+waste_etag = WasteCatalogConditionalGet(
+    waste_catalog, max_age=config.cache_config.HTTP_CACHE_WASTE_MAX_AGE
+)
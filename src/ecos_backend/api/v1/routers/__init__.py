@@ -6,16 +6,22 @@ from ecos_backend.common import config
 
 from ecos_backend.api.v1.routers import homepage
 from ecos_backend.api.v1.routers import user
+from ecos_backend.api.v1.routers import accrual_history
 from ecos_backend.api.v1.routers import reception_point
 from ecos_backend.api.v1.routers import waste
 from ecos_backend.api.v1.routers import moderation
+from ecos_backend.api.v1.routers import leaderboard
+from ecos_backend.api.v1.routers import metrics
 
 
 class Tags(Enum):
     user: str = "User"
+    accrual_history: str = "Accrual history"
     reception_point: str = "Reception point"
     waste: str = "Waste"
     moderation: str = "Moderation"
+    leaderboard: str = "Leaderboard"
+    metrics: str = "Metrics"
 
 
 root = APIRouter()
@@ -24,6 +30,11 @@ root.include_router(homepage.router)
 api_router_v1 = APIRouter(prefix=f"{config.URLPathsConfig.API_PREFIX}/v1")
 
 api_router_v1.include_router(user.router, prefix="/users", tags=[Tags.user])
+api_router_v1.include_router(
+    accrual_history.router,
+    prefix="/users/profile/accrual-history",
+    tags=[Tags.accrual_history],
+)
 api_router_v1.include_router(
     reception_point.router, prefix="/reception-points", tags=[Tags.reception_point]
 )
@@ -31,5 +42,9 @@ api_router_v1.include_router(waste.router, prefix="/wastes", tags=[Tags.waste])
 api_router_v1.include_router(
     moderation.router, prefix="/moderations", tags=[Tags.moderation]
 )
+api_router_v1.include_router(
+    leaderboard.router, prefix="/leaderboard", tags=[Tags.leaderboard]
+)
+api_router_v1.include_router(metrics.router, prefix="/metrics", tags=[Tags.metrics])
 
 root.include_router(api_router_v1)
@@ -0,0 +1,34 @@
+import typing
+import uuid
+
+from fastapi import APIRouter, Depends, status
+
+from ecos_backend.api.v1 import annotations
+from ecos_backend.api.v1.schemas.accrual_history import (
+    AccrualHistoryListResponse,
+    AccrualHistoryPaginationParams,
+)
+
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="Get accrual history of the current user",
+    response_description="Accrual history retrieved successfully",
+    response_model=AccrualHistoryListResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_accrual_history(
+    pagination: typing.Annotated[AccrualHistoryPaginationParams, Depends()],
+    user_info: annotations.verify_token,
+    accrual_history_service: annotations.accrual_history_service,
+) -> typing.Any:
+    records, next_cursor = await accrual_history_service.get_user_accrual_histories(
+        uuid.UUID(user_info["sub"]),
+        per_page=pagination.per_page,
+        cursor=pagination.cursor,
+    )
+
+    return AccrualHistoryListResponse(items=records, next_cursor=next_cursor)
@@ -0,0 +1,67 @@
+import typing
+import uuid
+
+from fastapi import APIRouter, Depends, status
+
+from ecos_backend.api.v1 import annotations
+from ecos_backend.api.v1.schemas.leaderboard import (
+    LeaderboardItem,
+    LeaderboardParams,
+    LeaderboardRankParams,
+    LeaderboardRankResponse,
+    LeaderboardResponse,
+)
+from ecos_backend.db.models.leaderboard import LeaderboardEntry
+from ecos_backend.service.leaderboard import LeaderboardService
+
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="Get leaderboard",
+    response_description="Leaderboard retrieved successfully",
+    response_model=LeaderboardResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_leaderboard(
+    params: typing.Annotated[LeaderboardParams, Depends()],
+    leaderboard_service: annotations.leaderboard_service,
+    cache: annotations.cache,
+) -> typing.Any:
+    async def load() -> dict:
+        rows = await leaderboard_service.get_leaderboard(params.period, params.limit)
+        return LeaderboardResponse(
+            period=params.period,
+            items=[LeaderboardItem.model_validate(row) for row in rows],
+        ).model_dump(mode="json")
+
+    return await cache.get_or_set(
+        LeaderboardService.cache_key(params.period, params.limit),
+        load,
+        tags=[LeaderboardService.CACHE_TAG],
+    )
+
+
+@router.get(
+    "/me",
+    summary="Get rank of the current user",
+    response_description="Rank retrieved successfully",
+    response_model=LeaderboardRankResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_my_rank(
+    params: typing.Annotated[LeaderboardRankParams, Depends()],
+    user_info: annotations.verify_token,
+    leaderboard_service: annotations.leaderboard_service,
+) -> typing.Any:
+    entry: LeaderboardEntry | None = await leaderboard_service.get_user_rank(
+        params.period, uuid.UUID(user_info["sub"])
+    )
+    if entry is None:
+        return LeaderboardRankResponse(period=params.period)
+
+    return LeaderboardRankResponse(
+        period=params.period, rank=entry.rank, points=entry.points
+    )
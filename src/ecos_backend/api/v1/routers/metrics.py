@@ -0,0 +1,43 @@
+import dataclasses
+import typing
+
+from fastapi import APIRouter, status
+
+from ecos_backend.api.v1 import annotations, dependencies
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="Get runtime metrics",
+    response_description="Runtime metrics retrieved successfully",
+    response_model=dict[str, dict[str, typing.Any]],
+    status_code=status.HTTP_200_OK,
+)
+async def get_metrics(
+    user_info: annotations.verify_token,
+) -> typing.Any:
+    cache_stats = dependencies.cache.stats
+    cache_single_flight_stats = dependencies.cache.single_flight_stats
+    single_flight_stats = dependencies.single_flight.stats
+    return {
+        "database_pool": dependencies.database_client.pool_statistics(),
+        "presigned_url_cache": dataclasses.asdict(
+            dependencies.s3_client.signer.cache_stats
+        ),
+        "cache": {
+            **dataclasses.asdict(cache_stats),
+            "hit_ratio": cache_stats.hit_ratio,
+        },
+        "cache_single_flight": {
+            **dataclasses.asdict(cache_single_flight_stats),
+            "coalesced": cache_single_flight_stats.coalesced,
+            "coalescing_ratio": cache_single_flight_stats.coalescing_ratio,
+        },
+        "single_flight": {
+            **dataclasses.asdict(single_flight_stats),
+            "coalesced": single_flight_stats.coalesced,
+            "coalescing_ratio": single_flight_stats.coalescing_ratio,
+        },
+    }
@@ -1,10 +1,19 @@
 import typing
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+
+from ecos_backend.service.reception_point import StatusUpdate
 
 from ecos_backend.api.v1 import annotations
-from ecos_backend.api.v1.schemas.moderation import ModerationResponseSchema
-from ecos_backend.db.models.moderation import Moderation
+from ecos_backend.api.v1.schemas.moderation import (
+    ModerationBulkRequestSchema,
+    ModerationBulkResponse,
+    ModerationFilterParams,
+    ModerationListResponse,
+    ModerationPaginationParams,
+    ModerationQueueParams,
+    ModerationQueueResponse,
+)
 
 router = APIRouter()
 
@@ -13,12 +22,65 @@ router = APIRouter()
     "",
     summary="Get moderations",
     response_description="Moderations retrieved successfully",
-    response_model=list[ModerationResponseSchema],
+    response_model=ModerationListResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_moderations(
     user_info: annotations.verify_token,
+    filter: typing.Annotated[ModerationFilterParams, Depends()],
+    pagination: typing.Annotated[ModerationPaginationParams, Depends()],
     moderation_service: annotations.moderation_service,
 ) -> typing.Any:
-    moderations: list[Moderation] = await moderation_service.get_moderations()
-    return moderations
+    moderations, next_cursor = await moderation_service.get_moderations(
+        filters=filter.model_dump(exclude_none=True),
+        per_page=pagination.per_page,
+        cursor=pagination.cursor,
+    )
+    return ModerationListResponse(items=moderations, next_cursor=next_cursor)
+
+
+@router.get(
+    "/queue",
+    summary="Get reception points awaiting moderation",
+    response_description="Moderation queue retrieved successfully",
+    response_model=ModerationQueueResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_moderation_queue(
+    user_info: annotations.verify_token,
+    pagination: typing.Annotated[ModerationQueueParams, Depends()],
+    moderation_service: annotations.moderation_service,
+) -> typing.Any:
+    include: set[str] | None = pagination.include_set()
+
+    points, next_cursor = await moderation_service.get_queue(
+        per_page=pagination.per_page,
+        cursor=pagination.cursor,
+        include=include,
+    )
+    return ModerationQueueResponse(items=points, next_cursor=next_cursor)
+
+
+@router.post(
+    "/bulk",
+    summary="Update statuses of many reception points",
+    response_description="Statuses processed, see the outcome of each item",
+    response_model=ModerationBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def bulk_update_reception_point_statuses(
+    user_info: annotations.verify_token,
+    data: ModerationBulkRequestSchema,
+    reception_point_service: annotations.reception_point_service,
+) -> typing.Any:
+    outcomes = await reception_point_service.update_statuses(
+        [
+            StatusUpdate(
+                reception_point_id=item.reception_point_id,
+                status=item.status,
+                comment=item.comment,
+            )
+            for item in data.items
+        ]
+    )
+    return ModerationBulkResponse(items=outcomes)
@@ -11,13 +11,17 @@ from ecos_backend.common import enums, validation
 from ecos_backend.common import exception as custom_exceptions
 
 from ecos_backend.db.models.reception_point import ReceptionPoint
+from ecos_backend.service.reception_point import StatusUpdate
 
 from ecos_backend.api.v1 import annotations
 from ecos_backend.api.v1.schemas.base import BaseInforamtionResponse
 from ecos_backend.api.v1.schemas.reception_point import (
+    NearbyParams,
     PaginationParams,
     ReceptionPointFilterParams,
     ReceptionPointListResponse,
+    ReceptionPointNearbyItem,
+    ReceptionPointNearbyListResponse,
     ReceptionPointRequestCreateSchema,
     ReceptionPointResponseSchema,
 )
@@ -84,26 +88,61 @@ async def create_reception_point(
     status_code=status.HTTP_200_OK,
 )
 async def get_reception_points(
+    etag: annotations.reception_point_etag,
     filter: typing.Annotated[ReceptionPointFilterParams, Depends()],
     pagination: typing.Annotated[PaginationParams, Depends()],
     reception_point_service: annotations.reception_point_service,
 ) -> typing.Any:
-    reception_points: list[
-        ReceptionPoint
-    ] = await reception_point_service.get_reception_points(
+    include: set[str] | None = pagination.include_set()
+
+    (
+        reception_points,
+        total,
+        next_cursor,
+    ) = await reception_point_service.get_reception_points(
         filters=filter.model_dump(exclude_none=True),
         page=pagination.page,
         per_page=pagination.per_page,
+        cursor=pagination.cursor,
+        include=include,
     )
 
     return ReceptionPointListResponse(
         items=reception_points,
-        total=len(reception_points),
+        total=total,
         page=pagination.page,
         per_page=pagination.per_page,
-        total_pages=(
-            (len(reception_points) + pagination.per_page - 1) // pagination.per_page
-        ),
+        total_pages=(total + pagination.per_page - 1) // pagination.per_page,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/nearby",
+    summary="Get nearest reception points",
+    response_description="Reception points retrieved successfully",
+    response_model=ReceptionPointNearbyListResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_nearby_reception_points(
+    params: typing.Annotated[NearbyParams, Depends()],
+    reception_point_service: annotations.reception_point_service,
+) -> typing.Any:
+    points, next_cursor = await reception_point_service.get_nearby_reception_points(
+        latitude=params.latitude,
+        longitude=params.longitude,
+        radius=params.radius,
+        waste_id=params.waste_id,
+        per_page=params.per_page,
+        cursor=params.cursor,
+    )
+
+    return ReceptionPointNearbyListResponse(
+        items=[
+            ReceptionPointNearbyItem(distance=distance, reception_point=point)
+            for point, distance in points
+        ],
+        next_cursor=next_cursor,
     )
 
 
@@ -115,6 +154,7 @@ async def get_reception_points(
     status_code=status.HTTP_200_OK,
 )
 async def get_reception_point(
+    etag: annotations.reception_point_etag,
     reception_point: annotations.reception_point_by_id,
 ) -> typing.Any:
     return reception_point
@@ -189,22 +229,19 @@ async def update_reception_point_status(
     reception_point_id: typing.Annotated[uuid.UUID, Path],
     reception_point_service: annotations.reception_point_service,
 ) -> typing.Any:
-    reception_point: (
-        ReceptionPoint | None
-    ) = await reception_point_service.get_reception_point_by_id(reception_point_id)
-
-    if reception_point is None:
-        raise custom_exceptions.NotFoundException(
-            detail=f"Reception point with {reception_point_id} id not found."
-        )
-
-    await reception_point_service.update_status(
-        reception_point=reception_point,
-        comment=data.comment,
-        status=data.status,
-        user_id=reception_point.user_id,
+    [outcome] = await reception_point_service.update_statuses(
+        [
+            StatusUpdate(
+                reception_point_id=reception_point_id,
+                status=data.status,
+                comment=data.comment,
+            )
+        ]
     )
 
+    if outcome.status == enums.Status.FAILURE:
+        raise custom_exceptions.NotFoundException(detail=outcome.detail)
+
     return BaseInforamtionResponse(
         message="Reception point status updated successfully",
         status=enums.Status.SUCCESS,
@@ -17,6 +17,7 @@ from ecos_backend.api.v1 import annotations
 from ecos_backend.api.v1.schemas import user as user_schemas
 from ecos_backend.api.v1.schemas.base import BaseInforamtionResponse
 from ecos_backend.db.models.user import User
+from ecos_backend.service.user import UserService
 
 
 router = APIRouter()
@@ -54,10 +55,19 @@ async def register_user(
 async def get_user(
     user_service: annotations.user_service,
     user_info: annotations.verify_token,
+    cache: annotations.cache,
 ) -> typing.Any:
     sub = user_info["sub"]
+
+    async def load() -> dict:
+        user: User = await fetch_user(sub, user_service)
+        return user_schemas.UserResponseSchema.model_validate(user).model_dump(
+            mode="json"
+        )
+
+    cache_key: str = UserService.cache_key(sub)
     try:
-        return await fetch_user(sub, user_service)
+        return await cache.get_or_set(cache_key, load, tags=[cache_key])
     except Exception as e:
         raise custom_exceptions.InternalServerException(detail=str(e))
 
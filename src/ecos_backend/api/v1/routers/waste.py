@@ -16,6 +16,7 @@ from ecos_backend.api.v1.schemas.waste import (
     WasteResponseSchema,
 )
 from ecos_backend.db.models.waste import Waste
+from ecos_backend.service.waste import WasteEntry
 
 router = APIRouter()
 
@@ -65,10 +66,13 @@ async def create_waste(
     status_code=status.HTTP_200_OK,
 )
 async def get_wastes(
+    etag: annotations.waste_etag,
     waste_service: annotations.waste_service,
     search_filter: annotations.search_filter = None,
 ) -> typing.Any:
-    waste_list: list[Waste] = await waste_service.get_wastes(filters=search_filter)
+    waste_list: list[WasteEntry] | list[Waste] = await waste_service.get_wastes(
+        filters=search_filter
+    )
     return waste_list
 
 
@@ -80,6 +84,7 @@ async def get_wastes(
     status_code=status.HTTP_200_OK,
 )
 async def get_waste(
+    etag: annotations.waste_etag,
     waste: annotations.waste_by_id,
 ) -> typing.Any:
     return waste
@@ -1,6 +1,8 @@
 import uuid
 
-from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from ecos_backend.common import enums
 
@@ -9,5 +11,28 @@ class AccrualHistoryBaseSchema(BaseModel):
     id: uuid.UUID
     points: int
     reward: enums.RewardType
+    created_at: datetime
 
     model_config: ConfigDict = ConfigDict(extra="forbid", from_attributes=True)
+
+
+class AccrualHistoryPaginationParams(BaseModel):
+    """Keyset pagination parameters for the accrual history"""
+
+    per_page: int = Field(20, ge=1, le=100, description="Items per page (max 100)")
+    cursor: str | None = Field(
+        None, description="Opaque cursor from next_cursor of the previous page"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AccrualHistoryListResponse(BaseModel):
+    """Page of the user's accrual history, newest first"""
+
+    items: list[AccrualHistoryBaseSchema] = Field(
+        ..., description="Accrual records ordered by creation time, newest first"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, absent on the last page"
+    )
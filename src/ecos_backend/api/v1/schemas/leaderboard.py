@@ -0,0 +1,55 @@
+import uuid
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ecos_backend.common import enums
+
+
+class LeaderboardParams(BaseModel):
+    """Leaderboard query parameters"""
+
+    period: enums.LeaderboardPeriod = Field(
+        enums.LeaderboardPeriod.ALL,
+        description="Ranking window: all time, current week or current month",
+    )
+    limit: int = Field(10, ge=1, le=100, description="Number of top users (max 100)")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class LeaderboardRankParams(BaseModel):
+    """Rank lookup query parameters"""
+
+    period: enums.LeaderboardPeriod = Field(
+        enums.LeaderboardPeriod.ALL,
+        description="Ranking window: all time, current week or current month",
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class LeaderboardItem(BaseModel):
+    rank: int = Field(..., ge=1, description="Position, shared by tied users")
+    user_id: uuid.UUID
+    points: int = Field(..., description="Points earned in the period")
+    first_name: str | None = None
+    last_name: str | None = None
+
+    model_config: ConfigDict = ConfigDict(extra="forbid", from_attributes=True)
+
+
+class LeaderboardResponse(BaseModel):
+    """Top users of a period"""
+
+    period: enums.LeaderboardPeriod
+    items: list[LeaderboardItem] = Field(..., description="Users ordered by rank")
+
+
+class LeaderboardRankResponse(BaseModel):
+    """Rank of the current user"""
+
+    period: enums.LeaderboardPeriod
+    rank: int | None = Field(
+        None, description="Position in the period, absent without points in it"
+    )
+    points: int = Field(0, description="Points earned in the period")
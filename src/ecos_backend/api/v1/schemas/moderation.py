@@ -1,11 +1,18 @@
 import datetime
 import uuid
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from ecos_backend.api.v1.schemas.reception_point import (
+    IncludeParamsMixin,
+    ReceptionPointResponseSchema,
+)
 from ecos_backend.common import enums
 
 
+MAX_BULK_ITEMS = 500
+
+
 class ModerationBaseSchema(BaseModel):
     id: uuid.UUID
     user_id: uuid.UUID
@@ -24,4 +31,105 @@ class ModerationRequestCreateSchema(BaseModel):
 
 
 class ModerationResponseSchema(ModerationBaseSchema):
+    reception_point_name: str | None = Field(
+        None, description="Name of the moderated reception point"
+    )
+    reception_point_status: enums.PointStatus | None = Field(
+        None, description="Current status of the moderated reception point"
+    )
+
+    model_config: ConfigDict = ConfigDict(from_attributes=True)
+
+
+class ModerationFilterParams(BaseModel):
+    """Parameters for filtering moderation records"""
+
+    reception_point_id: uuid.UUID | None = Field(
+        None, description="Filter by reception point ID"
+    )
+    user_id: uuid.UUID | None = Field(
+        None, description="Filter by the user the record was made for"
+    )
+    status: enums.PointStatus | None = Field(
+        None, description="Filter by current reception point status"
+    )
+    verified_after: datetime.datetime | None = Field(
+        None, description="Filter records made after this date"
+    )
+    verified_before: datetime.datetime | None = Field(
+        None, description="Filter records made before this date"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ModerationPaginationParams(BaseModel):
+    """Keyset pagination parameters"""
+
+    per_page: int = Field(20, ge=1, le=100, description="Items per page (max 100)")
+    cursor: str | None = Field(
+        None, description="Opaque cursor from next_cursor of the previous page"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ModerationQueueParams(ModerationPaginationParams, IncludeParamsMixin):
+    """Moderation queue parameters"""
+
+
+class ModerationListResponse(BaseModel):
+    """Page of moderation records, newest first"""
+
+    items: list[ModerationResponseSchema] = Field(
+        ..., description="Moderation records ordered by date, newest first"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, absent on the last page"
+    )
+
+
+class ModerationQueueResponse(BaseModel):
+    """Page of reception points awaiting moderation, oldest first"""
+
+    items: list[ReceptionPointResponseSchema] = Field(
+        ..., description="Reception points ordered by creation date, oldest first"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, absent on the last page"
+    )
+
+
+class ModerationBulkItemSchema(BaseModel):
+    reception_point_id: uuid.UUID
+    status: enums.PointStatus
+    comment: str | None = None
+
+    model_config: ConfigDict = ConfigDict(extra="forbid")
+
+
+class ModerationBulkRequestSchema(BaseModel):
+    """Status changes applied together in one transaction"""
+
+    items: list[ModerationBulkItemSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        description=f"Status changes (max {MAX_BULK_ITEMS})",
+    )
+
+    model_config: ConfigDict = ConfigDict(extra="forbid")
+
+
+class ModerationBulkItemResult(BaseModel):
+    reception_point_id: uuid.UUID
+    status: enums.Status
+    detail: str | None = Field(None, description="Reason of a failure")
+
     model_config: ConfigDict = ConfigDict(from_attributes=True)
+
+
+class ModerationBulkResponse(BaseModel):
+    """Outcome of each status change, in request order"""
+
+    items: list[ModerationBulkItemResult]
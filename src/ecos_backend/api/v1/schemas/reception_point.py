@@ -2,7 +2,15 @@ import typing
 import uuid
 import datetime
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    ValidationInfo,
+    field_validator,
+)
 
 from ecos_backend.api.v1.schemas.work_schedule import (
     WorkScheduleResponseSchema,
@@ -11,6 +19,11 @@ from ecos_backend.api.v1.schemas.work_schedule import (
 from ecos_backend.api.v1.schemas.waste import WasteResponseSchema
 
 from ecos_backend.common import config, enums
+from ecos_backend.common.exception import ValidationException
+from ecos_backend.common.urls import url_builder
+from ecos_backend.db.repositories.reception_point import (
+    ReceptionPointAbstractReposity,
+)
 
 
 class ReceptionPointFilterParams(BaseModel):
@@ -33,21 +46,79 @@ class ReceptionPointFilterParams(BaseModel):
     created_before: datetime.datetime | None = Field(
         None, description="Filter points created before this date"
     )
+    open_at: datetime.datetime | None = Field(
+        None, description="Filter points open at this date and time"
+    )
+    open_now: bool | None = Field(None, description="Filter points open right now")
 
     model_config = ConfigDict(extra="forbid")
 
 
-class PaginationParams(BaseModel):
+class IncludeParamsMixin(BaseModel):
+    """Selection of the related collections loaded with reception points"""
+
+    include: str | None = Field(
+        None,
+        description="Comma-separated related collections to load "
+        "(images, wastes, schedule); all of them when omitted",
+    )
+
+    def include_set(self) -> set[str] | None:
+        """Parsed include list, None when the parameter is omitted.
+
+        Raises ValidationException for values that name no relation.
+        """
+        if self.include is None:
+            return None
+
+        include: set[str] = {
+            name.strip() for name in self.include.split(",") if name.strip()
+        }
+        unknown: set[str] = include - set(ReceptionPointAbstractReposity.RELATIONS)
+        if unknown:
+            raise ValidationException(
+                detail=f"Unknown include value(s): {', '.join(sorted(unknown))}"
+            )
+        return include
+
+
+class PaginationParams(IncludeParamsMixin):
     """Pagination parameters"""
 
     page: int = Field(1, ge=1, description="Page number (1-based)")
     per_page: int = Field(20, ge=1, le=100, description="Items per page (max 100)")
+    cursor: str | None = Field(
+        None,
+        description="Opaque cursor from next_cursor; fetches the following page "
+        "by keyset instead of page number",
+    )
+
+
+class NearbyParams(BaseModel):
+    """Parameters for the nearest reception point search"""
+
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
+    radius: float = Field(
+        5000, gt=0, le=50000, description="Search radius in meters (max 50 km)"
+    )
+    waste_id: uuid.UUID | None = Field(
+        None, description="Only points accepting this waste type"
+    )
+    per_page: int = Field(20, ge=1, le=100, description="Items per page (max 100)")
+    cursor: str | None = Field(
+        None, description="Opaque cursor from next_cursor of the previous page"
+    )
+
+    model_config = ConfigDict(extra="forbid")
 
 
 class ReceptionPointBaseSchema(BaseModel):
     name: str
     address: str
     description: str | None
+    latitude: float | None = None
+    longitude: float | None = None
     user_id: uuid.UUID
     status: enums.PointStatus
 
@@ -58,6 +129,8 @@ class ReceptionPointRequestCreateSchema(BaseModel):
     name: str
     address: str
     description: str | None
+    latitude: float | None = Field(None, ge=-90, le=90)
+    longitude: float | None = Field(None, ge=-180, le=180)
     work_schedule: list[WorkScheduleRequestCreateSchema]
 
 
@@ -71,44 +144,41 @@ class ReceptionPointResponseSchema(ReceptionPointBaseSchema):
     )
     image_urls: list[HttpUrl] = Field(
         default_factory=list,
+        validation_alias=AliasChoices("image_urls", "reception_image"),
         description="List of full image URLs for the reception point ",
     )
     updated_at: datetime.datetime
 
     model_config: ConfigDict = ConfigDict(from_attributes=True)
 
-    @model_validator(mode="before")
-    def set_image_urls(cls, data: typing.Any) -> typing.Any:
-        """Generate full URLs for all reception point images."""
-        if isinstance(data, dict):
-            # Handle dictionary input
-            point_id = str(data.get("id", ""))
-            if "reception_image" in data:
-                data["image_urls"] = [
-                    f"{config.s3_config.ENDPOINT}/"
-                    f"{config.s3_config.RECEPTION_POINT_BUCKET}/"
-                    f"{point_id}/images/{img['filename']}"
-                    for img in data["reception_image"]
-                    if "filename" in img
-                ]
-                # Rename field for consistency
-                data["images"] = data.pop("reception_image")
-
-        elif hasattr(data, "id") and hasattr(data, "reception_image"):
-            # Handle SQLAlchemy model input
-            point_id = str(data.id)
-            data.image_urls = [
-                f"{config.s3_config.ENDPOINT}/"
-                f"{config.s3_config.RECEPTION_POINT_BUCKET}/"
-                f"{point_id}/images/{img.filename}"
-                for img in data.reception_image
-                if hasattr(img, "filename")
-            ]
-            # For backward compatibility
-            if not hasattr(data, "images"):
-                data.images = data.reception_image
-
-        return data
+    @field_validator("image_urls", mode="before")
+    @classmethod
+    def build_image_urls(cls, value: typing.Any, info: ValidationInfo) -> typing.Any:
+        """Turn the point's image records into full URLs.
+
+        Records come from the ORM relationship, a list projection row or a
+        dict; strings are taken as ready-made URLs.
+        """
+        if not value or "id" not in info.data:
+            return value
+
+        filenames: list[str] = []
+        urls: list[typing.Any] = []
+        for image in value:
+            if isinstance(image, str):
+                urls.append(image)
+                continue
+            filename: str | None = (
+                image.get("filename")
+                if isinstance(image, dict)
+                else getattr(image, "filename", None)
+            )
+            if filename:
+                filenames.append(filename)
+
+        return urls + url_builder.image_urls(
+            config.s3_config.RECEPTION_POINT_BUCKET, info.data["id"], filenames
+        )
 
 
 class ReceptionPointListResponse(BaseModel):
@@ -121,6 +191,9 @@ class ReceptionPointListResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Number of items per page")
     total_pages: int = Field(..., description="Total number of pages")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, absent on the last page"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -130,6 +203,25 @@ class ReceptionPointListResponse(BaseModel):
                 "page": 1,
                 "per_page": 20,
                 "total_pages": 0,
+                "next_cursor": None,
             }
         }
     )
+
+
+class ReceptionPointNearbyItem(BaseModel):
+    """Reception point with its distance from the search origin"""
+
+    distance: float = Field(..., description="Distance in meters")
+    reception_point: ReceptionPointResponseSchema
+
+
+class ReceptionPointNearbyListResponse(BaseModel):
+    """Distance-ordered page of reception points"""
+
+    items: list[ReceptionPointNearbyItem] = Field(
+        ..., description="Reception points ordered by distance"
+    )
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, absent on the last page"
+    )
@@ -7,6 +7,7 @@ from typing import Annotated
 from datetime import date, datetime
 
 from pydantic import (
+    AliasChoices,
     BaseModel,
     ConfigDict,
     HttpUrl,
@@ -15,13 +16,12 @@ from pydantic import (
     field_validator,
     model_validator,
     StringConstraints,
+    ValidationInfo,
 )
 
 from ecos_backend.api.v1.schemas.user_image import UserImageBaseSchema
-from ecos_backend.api.v1.schemas.accrual_history import AccrualHistoryBaseSchema
 from ecos_backend.common import config
-from ecos_backend.db.models.user import User
-from ecos_backend.db.models.user_image import UserImage
+from ecos_backend.common.urls import url_builder
 
 
 MAX_NAME_LENGTH = 32
@@ -70,8 +70,17 @@ class UserResponseSchema(UserBaseSchema):
         None, max_length=MAX_NAME_LENGTH, description="User's last name"
     )
     birth_date: date | None = Field(None, description="User's birth date (YYYY-MM-DD)")
-    image_url: HttpUrl | None = Field(None, description="URL to user's profile image")
-    points: int = Field(default=0, ge=0, description="User's loyalty points")
+    image_url: HttpUrl | None = Field(
+        None,
+        validation_alias=AliasChoices("image_url", "user_image"),
+        description="URL to user's profile image",
+    )
+    points: int = Field(
+        default=0,
+        ge=0,
+        validation_alias=AliasChoices("points", "points_total"),
+        description="User's loyalty points",
+    )
     email_verified: bool = Field(default=False, description="Is email verified")
     created_at: datetime = Field(..., description="User registration timestamp")
     updated_at: datetime = Field(..., description="Last profile update timestamp")
@@ -79,9 +88,6 @@ class UserResponseSchema(UserBaseSchema):
     user_image: list[UserImageBaseSchema] = Field(
         default_factory=list, description="User's profile images"
     )
-    accural_history: list[AccrualHistoryBaseSchema] = Field(
-        default_factory=list, description="User's accrual history"
-    )
 
     model_config: ConfigDict = ConfigDict(from_attributes=True)
 
@@ -93,22 +99,26 @@ class UserResponseSchema(UserBaseSchema):
             filter(None, [self.first_name, self.middle_name, self.last_name])
         )
 
-    @model_validator(mode="before")
-    def set_image_url(cls, data: typing.Any) -> typing.Any:
-        if isinstance(data, User) and hasattr(data, "user_image") and data.user_image:
-            first_image: UserImage = data.user_image[0]
-            data.image_url = f"{config.s3_config.ENDPOINT}/{config.s3_config.USER_BUCKET}/{data.id}/images/{first_image.filename}"
-        return data
-
-    @model_validator(mode="before")
-    def set_points(cls, data: typing.Any) -> typing.Any:
-        if (
-            isinstance(data, User)
-            and hasattr(data, "accural_history")
-            and data.accural_history
-        ):
-            data.points = sum(item.points for item in data.accural_history)
-        return data
+    @field_validator("image_url", mode="before")
+    @classmethod
+    def build_image_url(cls, value: typing.Any, info: ValidationInfo) -> typing.Any:
+        """Use the first profile image as the user's image URL."""
+        if isinstance(value, str) or value is None:
+            return value
+        if not value or "id" not in info.data:
+            return None
+
+        first_image: typing.Any = value[0]
+        filename: str | None = (
+            first_image.get("filename")
+            if isinstance(first_image, dict)
+            else getattr(first_image, "filename", None)
+        )
+        if not filename:
+            return None
+        return url_builder.image_urls(
+            config.s3_config.USER_BUCKET, info.data["id"], [filename]
+        )[0]
 
 
 class UserRequestUpdatePartialSchema(BaseModel):
@@ -3,7 +3,8 @@ import typing
 
 import fastapi
 
-from ecos_backend.common import config
+from ecos_backend.common import config, validation
+from ecos_backend.api.v1 import dependencies
 from ecos_backend.api.v1.routers import root
 
 
@@ -13,8 +14,24 @@ async def lifespan(_app: fastapi.FastAPI) -> typing.AsyncGenerator:
     Runs events before application startup and after application shutdown.
     """
 
+    if config.keycloak_config.KEYCLOAK_LOCAL_VERIFY:
+        await dependencies.token_verifier.refresh_jwks(force=True)
+
+    validation.FileTypeValidator.initialize()
+    dependencies.s3_client.start()
+    await dependencies.waste_catalog.start()
+    dependencies.points_reconciliation.start()
+    dependencies.leaderboard_refresh.start()
+
     yield
 
+    await dependencies.leaderboard_refresh.stop()
+    await dependencies.points_reconciliation.stop()
+    await dependencies.waste_catalog.stop()
+    await dependencies.cache.close()
+    dependencies.s3_client.close()
+    await dependencies.database_client.dispose()
+
 
 def create_app() -> fastapi.FastAPI:
     app: fastapi.FastAPI = fastapi.FastAPI(
@@ -0,0 +1,458 @@
+import asyncio
+import collections
+import dataclasses
+import json
+import logging
+import time
+import typing
+import uuid
+
+from ecos_backend.common.config import CacheConfig
+from ecos_backend.common.interfaces.cache import AbstractCacheBackend
+
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+T = typing.TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache(typing.Generic[K, V]):
+    """In-process LRU cache whose entries expire after a per-entry TTL.
+
+    The cache holds at most ``max_entries`` items; the least recently used
+    entry is evicted first. Expired entries are never returned.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self._max_entries: int = max_entries
+        self._ttl: float = ttl
+        self._data: collections.OrderedDict[K, tuple[float, V]] = (
+            collections.OrderedDict()
+        )
+        self._stats: CacheStats = CacheStats()
+
+    def get(self, key: K) -> V | None:
+        entry: tuple[float, V] | None = self._data.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        """Stores a value for ``ttl`` seconds, capped at the cache default."""
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0 or self._max_entries <= 0:
+            self._data.pop(key, None)
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+            self._stats.evictions += 1
+
+    def delete(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return dataclasses.replace(self._stats, size=len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether the key holds a live entry; does not touch the stats."""
+        entry: tuple[float, V] | None = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+
+@dataclasses.dataclass(slots=True)
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        return self.calls - self.executions
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Share of calls that joined a call already in flight."""
+        return self.coalesced / self.calls if self.calls else 0.0
+
+
+class SingleFlight(typing.Generic[T]):
+    """Runs one call per key at a time and shares its result.
+
+    The call runs as its own task, so a caller that is cancelled does not
+    cancel it for the others waiting on the same key. A caller that waits
+    longer than the timeout gets TimeoutError, and the stuck call is
+    forgotten so that later callers start a fresh one.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._timeout: float | None = timeout
+        self._calls: dict[typing.Hashable, asyncio.Future[T]] = {}
+        self._stats: SingleFlightStats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return dataclasses.replace(self._stats, in_flight=len(self._calls))
+
+    async def do(
+        self,
+        key: typing.Hashable,
+        func: typing.Callable[[], typing.Awaitable[T]],
+        *,
+        timeout: float | None = None,
+    ) -> T:
+        self._stats.calls += 1
+        call: asyncio.Future[T] | None = self._calls.get(key)
+        if call is None:
+            self._stats.executions += 1
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+
+        timeout = self._timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), timeout)
+        except TimeoutError:
+            self._stats.timeouts += 1
+            self._forget(key, call)
+            raise
+
+    def _forget(self, key: typing.Hashable, call: asyncio.Future[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+class MemoryCacheBackend(AbstractCacheBackend):
+    """Per-process backend; each worker keeps its own copy."""
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self._data: TTLCache[str, bytes] = TTLCache(max_entries=max_entries, ttl=ttl)
+        self._max_entries: int = max_entries
+        self._tags: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self._data.get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        *,
+        ttl: float,
+        tags: typing.Collection[str] = (),
+    ) -> None:
+        self._data.set(key, value, ttl=ttl)
+        for tag in tags:
+            keys: set[str] = self._tags.setdefault(tag, set())
+            keys.add(key)
+            if len(keys) > self._max_entries:
+                # Forget evicted and expired keys.
+                self._tags[tag] = {k for k in keys if k in self._data}
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.delete(key)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._data.delete(key)
+
+    async def acquire_lock(self, key: str, ttl: float) -> str | None:
+        # Within one process SingleFlight already lets a single caller fill.
+        return ""
+
+    async def release_lock(self, key: str, token: str) -> None:
+        return None
+
+
+class RedisCacheBackend(AbstractCacheBackend):
+    """Backend shared by all workers through a Redis-protocol server.
+
+    Works with Redis, Valkey or any compatible server, and with fakeredis in
+    tests. Tags are sets of keys; fill locks are SET NX keys with a timeout.
+    """
+
+    def __init__(self, client: typing.Any, *, prefix: str = "ecos:") -> None:
+        self._redis: typing.Any = client
+        self._prefix: str = prefix
+
+    @classmethod
+    def from_url(cls, url: str, *, prefix: str = "ecos:") -> "RedisCacheBackend":
+        from redis import asyncio as redis  # optional dependency
+
+        return cls(redis.from_url(url), prefix=prefix)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
+
+    def _lock(self, key: str) -> str:
+        return f"{self._prefix}lock:{key}"
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get(self._key(key))
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        *,
+        ttl: float,
+        tags: typing.Collection[str] = (),
+    ) -> None:
+        ttl_ms: int = max(int(ttl * 1000), 1)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key(key), value, px=ttl_ms)
+            for tag in tags:
+                # A tag set lives as long as the newest key added to it.
+                pipe.sadd(self._tag(tag), self._key(key))
+                pipe.pexpire(self._tag(tag), ttl_ms)
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._redis.delete(*(self._key(key) for key in keys))
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            members: set[bytes] = await self._redis.smembers(self._tag(tag))
+            if not members:
+                continue
+            # Remove only the members that were deleted, so keys tagged in
+            # the meantime stay invalidatable.
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(*members)
+                pipe.srem(self._tag(tag), *members)
+                await pipe.execute()
+
+    async def acquire_lock(self, key: str, ttl: float) -> str | None:
+        token: str = uuid.uuid4().hex
+        acquired: bool | None = await self._redis.set(
+            self._lock(key), token, nx=True, px=max(int(ttl * 1000), 1)
+        )
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        from redis.exceptions import WatchError
+
+        # Compare-and-delete, so a lock that expired and was taken by
+        # another worker is left alone.
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self._lock(key))
+                current: bytes | None = await pipe.get(self._lock(key))
+                if current is None or current.decode() != token:
+                    await pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(self._lock(key))
+                await pipe.execute()
+            except WatchError:
+                pass
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class Cache:
+    """JSON value cache over a pluggable backend.
+
+    get_or_set() fills a missing key once: concurrent callers in a process
+    share one load, and across processes the backend fill lock makes the
+    others wait for the value instead of loading it too. Backend failures
+    are logged and treated as misses, so the cache never fails a request;
+    a caller that waits on a shared load longer than single_flight_timeout
+    gets TimeoutError.
+    """
+
+    LOCK_POLL_INTERVAL: float = 0.05
+
+    def __init__(
+        self,
+        backend: AbstractCacheBackend,
+        *,
+        ttl: float,
+        lock_timeout: float = 5.0,
+        single_flight_timeout: float | None = None,
+    ) -> None:
+        self._backend: AbstractCacheBackend = backend
+        self._ttl: float = ttl
+        self._lock_timeout: float = lock_timeout
+        self._single_flight: SingleFlight[typing.Any] = SingleFlight(
+            timeout=single_flight_timeout
+        )
+        self._stats: CacheStats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        return dataclasses.replace(self._stats)
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats:
+        return self._single_flight.stats
+
+    async def get(self, key: str) -> typing.Any | None:
+        value: typing.Any | None = await self._get(key)
+        if value is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        return value
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: typing.Callable[[], typing.Awaitable[typing.Any]],
+        *,
+        ttl: float | None = None,
+        tags: typing.Collection[str] = (),
+    ) -> typing.Any:
+        """Returns the cached value of key, loading and storing it on a miss.
+
+        The loaded value must be JSON-serializable; None is not cached.
+        """
+        value: typing.Any | None = await self.get(key)
+        if value is not None:
+            return value
+
+        return await self._single_flight.do(
+            key, lambda: self._fill(key, loader, ttl=ttl, tags=tags)
+        )
+
+    async def set(
+        self,
+        key: str,
+        value: typing.Any,
+        *,
+        ttl: float | None = None,
+        tags: typing.Collection[str] = (),
+    ) -> None:
+        try:
+            await self._backend.set(
+                key,
+                json.dumps(value, separators=(",", ":")).encode(),
+                ttl=self._ttl if ttl is None else ttl,
+                tags=tags,
+            )
+        except Exception:
+            logger.exception("Failed to store cache key %s", key)
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self._backend.delete(*keys)
+        except Exception:
+            logger.exception("Failed to delete cache keys %s", keys)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        try:
+            await self._backend.invalidate_tags(*tags)
+        except Exception:
+            logger.exception("Failed to invalidate cache tags %s", tags)
+
+    async def close(self) -> None:
+        await self._backend.close()
+
+    async def _get(self, key: str) -> typing.Any | None:
+        try:
+            raw: bytes | None = await self._backend.get(key)
+        except Exception:
+            logger.exception("Failed to read cache key %s", key)
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def _fill(
+        self,
+        key: str,
+        loader: typing.Callable[[], typing.Awaitable[typing.Any]],
+        *,
+        ttl: float | None,
+        tags: typing.Collection[str],
+    ) -> typing.Any:
+        try:
+            token: str | None = await self._backend.acquire_lock(
+                key, self._lock_timeout
+            )
+        except Exception:
+            logger.exception("Failed to lock cache key %s", key)
+            token = ""
+
+        if token is None:
+            # Another process is filling the key; wait for its value and
+            # load it ourselves only if it does not arrive in time.
+            deadline: float = time.monotonic() + self._lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+                value: typing.Any | None = await self._get(key)
+                if value is not None:
+                    return value
+
+        try:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl=ttl, tags=tags)
+            return value
+        finally:
+            if token:
+                try:
+                    await self._backend.release_lock(key, token)
+                except Exception:
+                    logger.exception("Failed to unlock cache key %s", key)
+
+
+def cache_factory(config: CacheConfig) -> Cache:
+    backend: AbstractCacheBackend
+    if config.CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend.from_url(
+            config.CACHE_REDIS_URL, prefix=config.CACHE_PREFIX
+        )
+    else:
+        backend = MemoryCacheBackend(
+            max_entries=config.CACHE_MAX_ENTRIES, ttl=config.CACHE_TTL
+        )
+    return Cache(
+        backend,
+        ttl=config.CACHE_TTL,
+        lock_timeout=config.CACHE_LOCK_TIMEOUT,
+        single_flight_timeout=config.SINGLE_FLIGHT_TIMEOUT,
+    )
@@ -1,3 +1,5 @@
+import typing
+
 from dataclasses import dataclass
 
 from pydantic import EmailStr
@@ -34,6 +36,14 @@ class DatabaseConfig(BaseSettings):
     POSTGRES_ADDRESS: str
     ECHO: bool = False
 
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0
+    POOL_RECYCLE: int = 1800
+    POOL_PRE_PING: bool = True
+    STATEMENT_CACHE_SIZE: int = 100
+    STATEMENT_TIMEOUT: int = 30000  # milliseconds, 0 disables the limit
+
     @property
     def database_url_asyncpg(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_ADDRESS}:{self.DATABASE_PORT}/{self.POSTGRES_DB}"
@@ -55,6 +65,19 @@ class KeycloakConfig(BaseSettings):
     KEYCLOAK_ADMIN_NAME: str = "admin"
     KEYCLOAK_ADMIN_PASSWORD: str = "admin"
     KEYCLOAK_ADMIN_REALM: str = "master"
+    KEYCLOAK_LOCAL_VERIFY: bool = False
+    KEYCLOAK_AUDIENCE: str | None = "account"
+    KEYCLOAK_ISSUER: str | None = None
+    KEYCLOAK_JWT_LEEWAY: int = 30
+    KEYCLOAK_JWKS_MIN_REFRESH_INTERVAL: int = 30
+    KEYCLOAK_TOKEN_CACHE_SIZE: int = 10000
+    KEYCLOAK_TOKEN_CACHE_TTL: int = 300
+
+    @property
+    def issuer(self) -> str:
+        if self.KEYCLOAK_ISSUER:
+            return self.KEYCLOAK_ISSUER
+        return f"{self.KEYCLOAK_SERVER_URL.rstrip('/')}/realms/{self.KEYCLOAK_REALM}"
 
 
 class S3Config(BaseSettings):
@@ -63,8 +86,40 @@ class S3Config(BaseSettings):
     RECEPTION_POINT_BUCKET: str = "default_bucket"
     WASTE_BUCKET: str = "default_bucket"
     ENDPOINT: str = "http://localhost:9000"
+    PUBLIC_BASE_URL: str | None = None  # CDN or public host in front of ENDPOINT
     ACCESS_KEY: str = "admin"
     SECRET_KEY: str = "admin"
+    MAX_POOL_CONNECTIONS: int = 10
+    THREAD_POOL_SIZE: int = 10
+    UPLOAD_CONCURRENCY: int = 5
+    PRESIGNED_URL_EXPIRES_IN: int = 3600
+    PRESIGNED_URL_REFRESH_MARGIN: int = 300  # re-sign this long before expiry
+    PRESIGNED_URL_CACHE_SIZE: int = 10000
+    SIGNED_BUCKETS: list[str] = []  # private buckets served by presigned URLs
+
+
+class ScheduleConfig(BaseSettings):
+    SCHEDULE_TIMEZONE: str = "Europe/Moscow"
+
+
+class CacheConfig(BaseSettings):
+    HTTP_CACHE_MAX_AGE: int = 0  # seconds; 0 makes clients revalidate every time
+    HTTP_CACHE_WASTE_MAX_AGE: int = 300
+    WASTE_CATALOG_POLL_INTERVAL: float = 5.0  # seconds, 0 disables polling
+
+    # "memory" keeps a cache per worker; "redis" shares one across the fleet
+    CACHE_BACKEND: typing.Literal["memory", "redis"] = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_PREFIX: str = "ecos:"
+    CACHE_TTL: int = 60
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_LOCK_TIMEOUT: float = 5.0
+    SINGLE_FLIGHT_TIMEOUT: float = 10.0  # seconds a caller waits for a shared read
+
+
+class JobsConfig(BaseSettings):
+    POINTS_RECONCILIATION_INTERVAL: float = 3600.0  # seconds, 0 disables the job
+    LEADERBOARD_REFRESH_INTERVAL: float = 300.0  # seconds, 0 disables the job
 
 
 class SMTPConfig(BaseSettings):
@@ -86,3 +141,6 @@ uvicorn_config: UvicornConfig = UvicornConfig()
 keycloak_config: KeycloakConfig = KeycloakConfig()
 s3_config: S3Config = S3Config()
 smtp_config: SMTPConfig = SMTPConfig()
+schedule_config: ScheduleConfig = ScheduleConfig()
+cache_config: CacheConfig = CacheConfig()
+jobs_config: JobsConfig = JobsConfig()
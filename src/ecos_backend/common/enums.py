@@ -24,3 +24,9 @@ class DayOfWeek(enum.Enum):
     FRIDAY: int = 5
     SATURDAY: int = 6
     SUNDAY: int = 7
+
+
+class LeaderboardPeriod(enum.Enum):
+    ALL: str = "all"
+    WEEK: str = "week"
+    MONTH: str = "month"
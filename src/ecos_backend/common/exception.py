@@ -46,3 +46,15 @@ class ValidationException(HTTPException):
 class InternalServerException(HTTPException):
     def __init__(self, detail: str) -> None:
         super(InternalServerException, self).__init__(status_code=500, detail=detail)
+
+
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: str) -> None:
+        super(ServiceUnavailableException, self).__init__(
+            status_code=503, detail=detail
+        )
+
+
+class NotModifiedException(HTTPException):
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        super(NotModifiedException, self).__init__(status_code=304, headers=headers)
@@ -0,0 +1,42 @@
+import abc
+import typing
+
+
+class AbstractCacheBackend(abc.ABC):
+    """Byte-oriented store behind ecos_backend.common.cache.Cache."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        *,
+        ttl: float,
+        tags: typing.Collection[str] = (),
+    ) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Deletes every key stored with any of the tags."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def acquire_lock(self, key: str, ttl: float) -> str | None:
+        """Takes the fill lock of a key; returns a token, or None if taken."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def release_lock(self, key: str, token: str) -> None:
+        raise NotImplementedError()
+
+    async def close(self) -> None:
+        return None
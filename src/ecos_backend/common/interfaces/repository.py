@@ -2,11 +2,11 @@ import abc
 import uuid
 import typing
 
-from sqlalchemy import select, Select, Result
+from sqlalchemy import insert, select, Select, Result
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ecos_backend.db.models.base import Base
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Load, RelationshipProperty
 
 
@@ -32,10 +32,18 @@ class AbstractRepository(typing.Generic[T], abc.ABC):
     ) -> list[T]:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    async def count(self, *, filters: dict[str, typing.Any] | None = None) -> int:
+        raise NotImplementedError()
+
     @abc.abstractmethod
     async def add(self, record: T) -> T:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    async def add_many(self, rows: list[dict[str, typing.Any]]) -> None:
+        raise NotImplementedError()
+
     @abc.abstractmethod
     async def delete(self, record: T) -> None:
         raise NotImplementedError()
@@ -72,19 +80,9 @@ class AbstractSqlRepository(AbstractRepository[T], abc.ABC):
     ) -> Select:
         stmt = select(self._model_cls)
 
-        if filters:
-            where_clauses = []
-            for column, value in filters.items():
-                if not hasattr(self._model_cls, column):
-                    raise ValueError(f"Invalid column name {column}")
-
-                if isinstance(value, (list, tuple)):
-                    where_clauses.append(getattr(self._model_cls, column).in_(value))
-                else:
-                    where_clauses.append(getattr(self._model_cls, column) == value)
-
-            if where_clauses:
-                stmt: Select[tuple[T]] = stmt.where(and_(*where_clauses))
+        where_clauses: list = self._construct_where_clauses(filters)
+        if where_clauses:
+            stmt: Select[tuple[T]] = stmt.where(and_(*where_clauses))
 
         if options:
             stmt = stmt.options(*options)
@@ -100,6 +98,95 @@ class AbstractSqlRepository(AbstractRepository[T], abc.ABC):
 
         return stmt
 
+    def _construct_where_clauses(
+        self, filters: dict[str, typing.Any] | None = None
+    ) -> list:
+        """Compiles filters into where clauses.
+
+        Keys are column or relationship names, optionally followed by an
+        operator: "name__ilike", "created_at__gte", "waste__any". Without an
+        operator a list or tuple value means membership and anything else
+        means equality.
+        """
+
+        where_clauses: list = []
+        for key, value in (filters or {}).items():
+            column, _, operator = key.partition("__")
+            where_clauses.append(
+                self._construct_filter_clause(column, operator or None, value)
+            )
+
+        return where_clauses
+
+    def _construct_filter_clause(
+        self, column: str, operator: str | None, value: typing.Any
+    ) -> typing.Any:
+        if not hasattr(self._model_cls, column):
+            raise ValueError(f"Invalid column name {column}")
+
+        attribute = getattr(self._model_cls, column)
+
+        if isinstance(attribute.property, RelationshipProperty):
+            return self._construct_relationship_clause(attribute, operator, value)
+
+        match operator:
+            case None:
+                if isinstance(value, (list, tuple)):
+                    return attribute.in_(value)
+                return attribute == value
+            case "in":
+                return attribute.in_(value)
+            case "ne":
+                return attribute != value
+            case "ilike":
+                return attribute.icontains(value, autoescape=True)
+            case "prefix":
+                return attribute.istartswith(value, autoescape=True)
+            case "gt":
+                return attribute > value
+            case "gte":
+                return attribute >= value
+            case "lt":
+                return attribute < value
+            case "lte":
+                return attribute <= value
+
+        raise ValueError(f"Invalid filter operator {operator} for {column}")
+
+    def _construct_relationship_clause(
+        self, attribute: typing.Any, operator: str | None, value: typing.Any
+    ) -> typing.Any:
+        """Filters by related primary keys with an EXISTS subquery."""
+        if operator not in (None, "any"):
+            raise ValueError(f"Invalid filter operator {operator} for {attribute.key}")
+
+        related_id = attribute.property.mapper.class_.id
+        condition = (
+            related_id.in_(value)
+            if isinstance(value, (list, tuple))
+            else related_id == value
+        )
+
+        if attribute.property.uselist:
+            return attribute.any(condition)
+        return attribute.has(condition)
+
+    def _construct_count_stmt(
+        self, *, filters: dict[str, typing.Any] | None = None
+    ) -> Select:
+        stmt: Select[tuple[int]] = select(func.count()).select_from(self._model_cls)
+
+        where_clauses: list = self._construct_where_clauses(filters)
+        if where_clauses:
+            stmt = stmt.where(and_(*where_clauses))
+
+        return stmt
+
+    async def count(self, *, filters: dict[str, typing.Any] | None = None) -> int:
+        stmt: Select = self._construct_count_stmt(filters=filters)
+        result: Result = await self._session.execute(stmt)
+        return result.scalar_one()
+
     async def get_all(
         self,
         *,
@@ -125,6 +212,15 @@ class AbstractSqlRepository(AbstractRepository[T], abc.ABC):
         await self._session.refresh(record)
         return record
 
+    async def add_many(self, rows: list[dict[str, typing.Any]]) -> None:
+        """Inserts column-value rows with a single multi-row INSERT.
+
+        Rows bypass the session, so they are not loaded as objects.
+        """
+        if not rows:
+            return
+        await self._session.execute(insert(self._model_cls).values(rows))
+
     async def delete(self, record: T) -> None:
         await self._session.delete(record)
         await self._session.flush()
@@ -9,6 +9,8 @@ from ecos_backend.db.repositories import (
     reception_point,
     reception_image,
     user_image,
+    table_version,
+    leaderboard,
 )
 
 
@@ -21,6 +23,8 @@ class AbstractUnitOfWork(abc.ABC):
     reception_image: reception_image.ReceptionImageAbstractReposity
     moderation: moderation.ModerationAbstractReposity
     accrual_history: accrual_history.AccrualHistoryAbstractReposity
+    table_version: table_version.TableVersionAbstractReposity
+    leaderboard: leaderboard.LeaderboardAbstractReposity
 
     @abc.abstractmethod
     async def __aenter__(self) -> "AbstractUnitOfWork":
@@ -1,3 +1,12 @@
+import asyncio
+import hashlib
+import json
+import time
+
+from jwcrypto import jwk, jwt
+from jwcrypto.common import JWException
+
+from ecos_backend.common.cache import CacheStats, TTLCache
 from ecos_backend.common.config import keycloak_config
 from keycloak import KeycloakAdmin, KeycloakOpenID, KeycloakOpenIDConnection
 
@@ -43,3 +52,115 @@ class KeycloakClientAdapter:
     def __call__(self) -> KeycloakOpenID:
         """Allows the class instance to be used as a dependency."""
         return self._openid
+
+
+class InvalidTokenException(Exception):
+    def __init__(self, detail: str) -> None:
+        self.detail: str = detail
+
+
+class KeycloakTokenVerifier:
+    """Verifies bearer tokens locally against the realm JWKS.
+
+    The key set is fetched once and refreshed only when a token is signed
+    with an unknown key ID, at most once per refresh interval. Verified
+    claims are cached by token hash until the token expires.
+    """
+
+    ALLOWED_ALGORITHMS: list[str] = ["RS256", "RS384", "RS512", "ES256", "PS256"]
+
+    def __init__(
+        self,
+        openid: KeycloakOpenID,
+        *,
+        issuer: str,
+        audience: str | None = None,
+        leeway: int = 30,
+        min_refresh_interval: int = 30,
+        cache_size: int = 10000,
+        cache_ttl: int = 300,
+    ) -> None:
+        self._openid: KeycloakOpenID = openid
+        self._issuer: str = issuer
+        self._audience: str | None = audience
+        self._leeway: int = leeway
+        self._min_refresh_interval: int = min_refresh_interval
+
+        self._jwks: jwk.JWKSet | None = None
+        self._last_refresh: float = 0.0
+        self._refresh_lock: asyncio.Lock = asyncio.Lock()
+        self._claims_cache: TTLCache[bytes, dict] = TTLCache(
+            max_entries=cache_size, ttl=cache_ttl
+        )
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._claims_cache.stats
+
+    async def refresh_jwks(self, *, force: bool = False) -> None:
+        """Fetches the realm key set, coalescing concurrent refreshes."""
+        last_refresh: float = self._last_refresh
+        async with self._refresh_lock:
+            if self._last_refresh != last_refresh:
+                # Another coroutine refreshed the keys while we were waiting.
+                return
+            if (
+                not force
+                and self._jwks is not None
+                and time.monotonic() - self._last_refresh < self._min_refresh_interval
+            ):
+                return
+
+            certs: dict = await self._openid.a_certs()
+            self._jwks = jwk.JWKSet.from_json(json.dumps(certs))
+            self._last_refresh = time.monotonic()
+
+    async def verify(self, token: str) -> dict:
+        """Returns verified token claims or raises InvalidTokenException."""
+        cache_key: bytes = hashlib.sha256(token.encode()).digest()
+        claims: dict | None = self._claims_cache.get(cache_key)
+        if claims is not None:
+            return claims
+
+        claims = await self._verify(token)
+
+        # Never keep the claims past the token expiry.
+        self._claims_cache.set(cache_key, claims, ttl=claims["exp"] - time.time())
+        return claims
+
+    async def _verify(self, token: str) -> dict:
+        if self._jwks is None:
+            await self.refresh_jwks(force=True)
+
+        try:
+            return self._decode(token)
+        except jwt.JWTMissingKey:
+            await self.refresh_jwks()
+
+        try:
+            return self._decode(token)
+        except JWException as e:
+            raise InvalidTokenException(detail=str(e)) from e
+
+    def _decode(self, token: str) -> dict:
+        check_claims: dict = {"exp": None, "iss": self._issuer}
+        if self._audience:
+            check_claims["aud"] = self._audience
+
+        try:
+            decoded = jwt.JWT(
+                algs=self.ALLOWED_ALGORITHMS,
+                check_claims=check_claims,
+                expected_type="JWS",
+            )
+            decoded.leeway = self._leeway
+            decoded.deserialize(token, key=self._jwks)
+        except jwt.JWTMissingKey:
+            raise
+        except (JWException, ValueError) as e:
+            raise InvalidTokenException(detail=str(e)) from e
+
+        claims: dict = json.loads(decoded.claims)
+        if "sub" not in claims:
+            raise InvalidTokenException(detail="Token has no subject")
+        return claims
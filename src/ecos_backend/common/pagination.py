@@ -0,0 +1,25 @@
+import base64
+import json
+import typing
+
+from ecos_backend.common.exception import BadRequestException
+
+
+def encode_cursor(*values: typing.Any) -> str:
+    """Encodes the sort key of the last row of a page into an opaque cursor."""
+    raw: bytes = json.dumps([str(value) for value in values]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, types: list[typing.Callable[[str], typing.Any]]
+) -> tuple:
+    """Decodes a cursor produced by encode_cursor, converting each value with types."""
+    try:
+        padded: str = cursor + "=" * (-len(cursor) % 4)
+        values: list = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("Unexpected cursor shape")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError) as e:
+        raise BadRequestException(detail="Invalid cursor") from e
@@ -0,0 +1,46 @@
+import asyncio
+import contextlib
+import logging
+import typing
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs a coroutine function every interval seconds in the background.
+
+    Failures are logged and the next run happens on schedule.
+    """
+
+    def __init__(
+        self,
+        func: typing.Callable[[], typing.Awaitable[typing.Any]],
+        *,
+        interval: float,
+        name: str,
+    ) -> None:
+        self._func: typing.Callable[[], typing.Awaitable[typing.Any]] = func
+        self._interval: float = interval
+        self._name: str = name
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Starts the loop; an interval of 0 or less disables it."""
+        if self._task is None and self._interval > 0:
+            self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self._func()
+            except Exception:
+                logger.exception("Periodic task %s failed", self._name)
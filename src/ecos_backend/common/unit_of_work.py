@@ -1,5 +1,8 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import typing
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ecos_backend.common.interfaces.repository import AbstractSqlRepository
 from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
 
 from ecos_backend.db.repositories.user import UserReposity
@@ -10,6 +13,8 @@ from ecos_backend.db.repositories.moderation import ModerationReposity
 from ecos_backend.db.repositories.accrual_history import AccrualHistoryReposity
 from ecos_backend.db.repositories.user_image import UserImageReposity
 from ecos_backend.db.repositories.reception_image import ReceptionImageReposity
+from ecos_backend.db.repositories.table_version import TableVersionReposity
+from ecos_backend.db.repositories.leaderboard import LeaderboardReposity
 
 
 from ecos_backend.db.models.user import User
@@ -20,29 +25,97 @@ from ecos_backend.db.models.moderation import Moderation
 from ecos_backend.db.models.accrual_history import AccrualHistory
 from ecos_backend.db.models.user_image import UserImage
 from ecos_backend.db.models.reception_image import ReceptionImage
+from ecos_backend.db.models.table_version import TableVersion
+from ecos_backend.db.models.leaderboard import LeaderboardEntry
 
 
 class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
-    def __init__(self, session: AsyncSession) -> None:
-        self._session: AsyncSession = session
+    """Unit of work that opens its session and repositories on first use.
 
-    async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
-        self.user = UserReposity(self._session, User)
-        self.user_image = UserImageReposity(self._session, UserImage)
-        self.reception_point = ReceptionPointReposity(self._session, ReceptionPoint)
-        self.reception_image = ReceptionImageReposity(self._session, ReceptionImage)
-        self.waste = WasteReposity(self._session, Waste)
-        self.work_schedule = WorkScheduleReposity(self._session, WorkSchedule)
-        self.moderation = ModerationReposity(self._session, Moderation)
-        self.accrual_history = AccrualHistoryReposity(self._session, AccrualHistory)
+    Requests that never reach a repository never create a session and so never
+    check a connection out of the pool.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory: async_sessionmaker[AsyncSession] = session_factory
+        self._session: AsyncSession | None = None
+        self._repositories: dict[str, AbstractSqlRepository] = {}
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def _repository(
+        self,
+        name: str,
+        repository_cls: type[AbstractSqlRepository],
+        model_cls: type,
+    ) -> typing.Any:
+        repository: AbstractSqlRepository | None = self._repositories.get(name)
+        if repository is None:
+            repository = repository_cls(self.session, model_cls)
+            self._repositories[name] = repository
+        return repository
+
+    @property
+    def user(self) -> UserReposity:
+        return self._repository("user", UserReposity, User)
+
+    @property
+    def user_image(self) -> UserImageReposity:
+        return self._repository("user_image", UserImageReposity, UserImage)
+
+    @property
+    def reception_point(self) -> ReceptionPointReposity:
+        return self._repository(
+            "reception_point", ReceptionPointReposity, ReceptionPoint
+        )
+
+    @property
+    def reception_image(self) -> ReceptionImageReposity:
+        return self._repository(
+            "reception_image", ReceptionImageReposity, ReceptionImage
+        )
 
+    @property
+    def waste(self) -> WasteReposity:
+        return self._repository("waste", WasteReposity, Waste)
+
+    @property
+    def work_schedule(self) -> WorkScheduleReposity:
+        return self._repository("work_schedule", WorkScheduleReposity, WorkSchedule)
+
+    @property
+    def moderation(self) -> ModerationReposity:
+        return self._repository("moderation", ModerationReposity, Moderation)
+
+    @property
+    def accrual_history(self) -> AccrualHistoryReposity:
+        return self._repository(
+            "accrual_history", AccrualHistoryReposity, AccrualHistory
+        )
+
+    @property
+    def table_version(self) -> TableVersionReposity:
+        return self._repository("table_version", TableVersionReposity, TableVersion)
+
+    @property
+    def leaderboard(self) -> LeaderboardReposity:
+        return self._repository("leaderboard", LeaderboardReposity, LeaderboardEntry)
+
+    async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
         return await super().__aenter__()
 
     async def __aexit__(self, *args, **kwargs) -> None:
         await super().__aexit__(*args, **kwargs)
-        await self._session.close()
+        if self._session is not None:
+            await self._session.close()
 
     async def commit(self) -> None:
+        if self._session is None:
+            return
         await self._session.commit()
 
     async def rollback(self) -> None:
@@ -57,5 +130,8 @@ class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
         https://pythonhint.com/post/1123713161982291/how-does-a-sqlalchemy-object-get-detached
         """
 
+        if self._session is None:
+            return
+
         self._session.expunge_all()
         await self._session.rollback()
@@ -0,0 +1,65 @@
+import typing
+
+from ecos_backend.common.config import S3Config, s3_config
+
+
+class URLSigner(typing.Protocol):
+    def sign_many(self, bucket_name: str, keys: typing.Sequence[str]) -> list[str]:
+        """Returns a signed GET URL for each key, in order."""
+        ...
+
+
+class ObjectURLBuilder:
+    """Builds client-facing URLs for stored objects.
+
+    The base prefix of each bucket is computed once and reused, so building
+    a URL is a single concatenation. Buckets registered with a signer get
+    presigned URLs instead, generated for all keys of a call at once.
+    """
+
+    def __init__(self, base_url: str) -> None:
+        self._base_url: str = base_url.rstrip("/")
+        self._prefixes: dict[str, str] = {}
+        self._signers: dict[str, URLSigner] = {}
+
+    def set_signer(self, bucket_name: str, signer: URLSigner | None) -> None:
+        """Serves bucket objects through signer, or publicly when None."""
+        if signer is None:
+            self._signers.pop(bucket_name, None)
+        else:
+            self._signers[bucket_name] = signer
+
+    def prefix(self, bucket_name: str) -> str:
+        prefix: str | None = self._prefixes.get(bucket_name)
+        if prefix is None:
+            prefix = self._prefixes[bucket_name] = f"{self._base_url}/{bucket_name}/"
+        return prefix
+
+    def build(self, bucket_name: str, key: str) -> str:
+        return self.build_many(bucket_name, [key])[0]
+
+    def build_many(self, bucket_name: str, keys: typing.Sequence[str]) -> list[str]:
+        signer: URLSigner | None = self._signers.get(bucket_name)
+        if signer is not None:
+            return signer.sign_many(bucket_name, keys)
+
+        prefix: str = self.prefix(bucket_name)
+        return [prefix + key for key in keys]
+
+    def image_urls(
+        self,
+        bucket_name: str,
+        owner_id: typing.Any,
+        filenames: typing.Iterable[str],
+    ) -> list[str]:
+        """URLs of images stored under the "<owner_id>/images/" prefix."""
+        return self.build_many(
+            bucket_name, [f"{owner_id}/images/{filename}" for filename in filenames]
+        )
+
+
+def url_builder_factory(config: S3Config) -> ObjectURLBuilder:
+    return ObjectURLBuilder(base_url=config.PUBLIC_BASE_URL or config.ENDPOINT)
+
+
+url_builder: ObjectURLBuilder = url_builder_factory(s3_config)
@@ -1,4 +1,6 @@
 import enum
+import tempfile
+import threading
 import typing
 import magic
 
@@ -38,10 +40,38 @@ class FileTypeValidator:
         "image/png": FileType.PNG.value,
     }
 
+    # Magic numbers of the allowed formats, checked before falling back to libmagic.
+    SIGNATURES: dict[bytes, str] = {
+        b"\xff\xd8\xff": "image/jpeg",
+        b"\x89PNG\r\n\x1a\n": "image/png",
+    }
+
+    HEADER_SIZE: int = 2048
+
+    _detector: magic.Magic | None = None
+    _detector_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def initialize(cls) -> magic.Magic:
+        """Loads the libmagic database once per process.
+
+        magic.Magic serializes calls on its own lock, so the handle is safe to
+        share between threads.
+        """
+        if cls._detector is None:
+            with cls._detector_lock:
+                if cls._detector is None:
+                    cls._detector = magic.Magic(mime=True)
+        return cls._detector
+
     @staticmethod
-    def validate(file_bytes: bytes) -> str:
-        mime = magic.Magic(mime=True)
-        file_type: str = mime.from_buffer(file_bytes)
+    def validate(file_bytes: bytes | memoryview) -> str:
+        # libmagic only needs the leading bytes, so copy just that slice.
+        header: bytes = bytes(file_bytes[: FileTypeValidator.HEADER_SIZE])
+
+        file_type: str | None = FileTypeValidator._match_signature(header)
+        if file_type is None:
+            file_type = FileTypeValidator.initialize().from_buffer(header)
 
         if file_type not in FileTypeValidator.ALLOWED_MIME_TYPES:
             raise InvalidFileTypeException(
@@ -50,22 +80,59 @@ class FileTypeValidator:
 
         return FileTypeValidator.ALLOWED_MIME_TYPES[file_type]
 
+    @staticmethod
+    def _match_signature(header: bytes) -> str | None:
+        for signature, mime_type in FileTypeValidator.SIGNATURES.items():
+            if header.startswith(signature):
+                return mime_type
+        return None
+
+
+class SpooledFileTarget(BaseTarget):
+    """Custom target that keeps small files in memory and spools larger ones to disk.
 
-class BytesTarget(BaseTarget):
-    """Custom target to store file content in bytes instead of saving to disk."""
+    The first ``HEADER_SIZE`` bytes are kept separately for MIME type sniffing.
+    """
 
-    def __init__(self, validator: typing.Optional[MaxSizeValidator] = None) -> None:
+    HEADER_SIZE: int = FileTypeValidator.HEADER_SIZE
+
+    def __init__(
+        self,
+        validator: typing.Optional[MaxSizeValidator] = None,
+        max_memory_size: int = 1024 * 1024,
+    ) -> None:
         super().__init__()
-        self._data = bytearray()
+        self._file: tempfile.SpooledTemporaryFile = tempfile.SpooledTemporaryFile(
+            max_size=max_memory_size
+        )
+        self._header = bytearray()
+        self._size: int = 0
         self.validator: MaxSizeValidator | None = validator
 
     def on_data_received(self, chunk: bytes) -> None:
-        """Appends received chunks to the bytearray."""
+        """Writes received chunks to the spooled file."""
         if self.validator:
             self.validator(chunk)
-        self._data.extend(chunk)
+        if len(self._header) < self.HEADER_SIZE:
+            self._header.extend(chunk[: self.HEADER_SIZE - len(self._header)])
+        self._file.write(chunk)
+        self._size += len(chunk)
+
+    @property
+    def header(self) -> memoryview:
+        """Returns a read-only view of the leading bytes of the file."""
+        return memoryview(self._header).toreadonly()
+
+    @property
+    def size(self) -> int:
+        """Returns the number of bytes received."""
+        return self._size
 
     @property
-    def content(self) -> bytes:
-        """Returns the file content as bytes."""
-        return bytes(self._data)
+    def file(self) -> typing.BinaryIO:
+        """Returns the file object rewound to the beginning."""
+        self._file.seek(0)
+        return self._file
+
+    def close(self) -> None:
+        self._file.close()
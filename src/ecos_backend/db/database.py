@@ -1,5 +1,10 @@
+import dataclasses
+import time
+
 from ecos_backend.common import config
 
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
@@ -7,11 +12,59 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
+@dataclasses.dataclass(slots=True)
+class PoolStatistics:
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.statistics: PoolStatistics = PoolStatistics()
+
+    def _do_get(self):
+        started: float = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.statistics.timeouts += 1
+            raise
+
+        waited: float = time.perf_counter() - started
+        self.statistics.checkouts += 1
+        self.statistics.total_wait_time += waited
+        self.statistics.max_wait_time = max(self.statistics.max_wait_time, waited)
+        return connection
+
+
 class Database:
-    def __init__(self, url: str, echo: bool = False) -> None:
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        connect_args: dict | None = None,
+    ) -> None:
         self._engine: AsyncEngine = create_async_engine(
             url=url,
             echo=echo,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args or {},
         )
 
         self._session_factory: async_sessionmaker = async_sessionmaker(
@@ -21,14 +74,54 @@ class Database:
             expire_on_commit=False,
         )
 
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        return self._session_factory
+
     async def session_dependency(self):
         async with self._session_factory() as session:
             yield session
             await session.close()
 
+    async def dispose(self) -> None:
+        """Closes all pooled connections."""
+        await self._engine.dispose()
+
+    def pool_statistics(self) -> dict:
+        """Returns the current pool occupancy and checkout wait statistics."""
+        pool: InstrumentedAsyncQueuePool = self._engine.pool
+        statistics: PoolStatistics = pool.statistics
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checkouts": statistics.checkouts,
+            "timeouts": statistics.timeouts,
+            "avg_wait_time": (
+                statistics.total_wait_time / statistics.checkouts
+                if statistics.checkouts
+                else 0.0
+            ),
+            "max_wait_time": statistics.max_wait_time,
+        }
+
 
 def database_factory(config: config.DatabaseConfig) -> Database:
+    server_settings: dict[str, str] = {}
+    if config.STATEMENT_TIMEOUT:
+        server_settings["statement_timeout"] = str(config.STATEMENT_TIMEOUT)
+
     return Database(
         url=config.database_url_asyncpg,
         echo=config.ECHO,
+        pool_size=config.POOL_SIZE,
+        max_overflow=config.MAX_OVERFLOW,
+        pool_timeout=config.POOL_TIMEOUT,
+        pool_recycle=config.POOL_RECYCLE,
+        pool_pre_ping=config.POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": config.STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        },
     )
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, func, text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ecos_backend.common import enums
@@ -13,6 +13,12 @@ from ecos_backend.db.models.base import Base
 
 class AccrualHistory(Base):
     __tablename__: str = "Accrual_History"
+    __table_args__ = (
+        Index(
+            "ix_Accrual_History_user_id_created_at_id", "user_id", "created_at", "id"
+        ),
+        Index("ix_Accrual_History_created_at", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, server_default=text("gen_random_uuid()")
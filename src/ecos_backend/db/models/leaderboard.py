@@ -0,0 +1,26 @@
+import uuid
+
+from sqlalchemy import BigInteger, Enum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ecos_backend.common import enums
+from ecos_backend.db.models.base import Base
+
+
+class LeaderboardEntry(Base):
+    """Row of the Leaderboard materialized view, ranked per period.
+
+    The view is created by a migration and refreshed by a periodic job;
+    migrations autogeneration skips it.
+    """
+
+    __tablename__: str = "Leaderboard"
+    __table_args__ = {"info": {"is_view": True}}
+
+    period: Mapped[enums.LeaderboardPeriod] = mapped_column(
+        Enum(enums.LeaderboardPeriod, native_enum=False, create_constraint=False),
+        primary_key=True,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    points: Mapped[int] = mapped_column(BigInteger)
+    rank: Mapped[int] = mapped_column(BigInteger)
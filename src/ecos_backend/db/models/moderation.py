@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, func, text
+from sqlalchemy import DateTime, ForeignKey, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ecos_backend.db.models.base import Base
@@ -12,6 +12,17 @@ from ecos_backend.db.models.base import Base
 
 class Moderation(Base):
     __tablename__: str = "Moderation"
+    __table_args__ = (
+        Index("ix_Moderation_verification_date_id", "verification_date", "id"),
+        Index(
+            "ix_Moderation_reception_point_id_verification_date",
+            "reception_point_id",
+            "verification_date",
+        ),
+        Index(
+            "ix_Moderation_user_id_verification_date", "user_id", "verification_date"
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, server_default=text("gen_random_uuid()")
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, String, DateTime, func, text
+from sqlalchemy import Enum, ForeignKey, Index, String, DateTime, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ecos_backend.common import enums
@@ -13,6 +13,33 @@ from ecos_backend.db.models.base import Base
 
 class ReceptionPoint(Base):
     __tablename__: str = "Reception_Point"
+    __table_args__ = (
+        Index("ix_Reception_Point_updated_at_id", "updated_at", "id"),
+        Index("ix_Reception_Point_created_at", "created_at"),
+        Index(
+            "ix_Reception_Point_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_Reception_Point_address_trgm",
+            "address",
+            postgresql_using="gin",
+            postgresql_ops={"address": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_Reception_Point_location",
+            text("ll_to_earth(latitude, longitude)"),
+            postgresql_using="gist",
+        ),
+        Index(
+            "ix_Reception_Point_pending_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'UNDER_MODERATION'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, server_default=text("gen_random_uuid()")
@@ -20,6 +47,11 @@ class ReceptionPoint(Base):
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None]
     address: Mapped[str] = mapped_column(String(255), unique=True)
+    latitude: Mapped[float | None]
+    longitude: Mapped[float | None]
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ecos_backend.db.models.base import Base
+
+
+class TableVersion(Base):
+    """Change counter of a table, bumped by every write to it."""
+
+    __tablename__: str = "Table_Version"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, server_default=text("0"))
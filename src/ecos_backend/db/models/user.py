@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from datetime import datetime, date
 
-from sqlalchemy import String, Date, DateTime, func, text
+from sqlalchemy import BigInteger, String, Date, DateTime, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ecos_backend.db.models.base import Base
@@ -23,6 +23,10 @@ class User(Base):
     email_verified: Mapped[bool] = mapped_column(default=False)
     birth_date: Mapped[date | None] = mapped_column(Date)
     verification_code: Mapped[str | None] = mapped_column(String(255))
+    # Sum of AccrualHistory.points, maintained by AccrualHistoryReposity.add
+    points_total: Mapped[int] = mapped_column(
+        BigInteger, default=0, server_default=text("0")
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -4,15 +4,32 @@ from typing import TYPE_CHECKING
 
 from datetime import time
 
-from sqlalchemy import Time, Enum, ForeignKey, text
+from sqlalchemy import Time, Enum, ForeignKey, Index, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ecos_backend.common import enums
 from ecos_backend.db.models.base import Base
 
 
+MINUTES_PER_DAY: int = 24 * 60
+MINUTES_PER_WEEK: int = 7 * MINUTES_PER_DAY
+
+
+def minute_of_week(day_of_week: enums.DayOfWeek, moment: time) -> int:
+    """Returns minutes elapsed since Monday 00:00."""
+    return (day_of_week.value - 1) * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
 class WorkSchedule(Base):
     __tablename__: str = "Work_Schedule"
+    __table_args__ = (
+        Index(
+            "ix_Work_Schedule_minute_of_week",
+            "open_minute_of_week",
+            "close_minute_of_week",
+        ),
+        Index("ix_Work_Schedule_reception_point_id", "reception_point_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, server_default=text("gen_random_uuid()")
@@ -23,6 +40,12 @@ class WorkSchedule(Base):
     open_time: Mapped[time | None] = mapped_column(default=Time)
     close_time: Mapped[time | None] = mapped_column(default=Time)
 
+    # Opening interval as [open, close) minutes of week, maintained on write.
+    # Intervals past midnight end after the next day's start, so a Sunday
+    # night interval may exceed MINUTES_PER_WEEK.
+    open_minute_of_week: Mapped[int | None]
+    close_minute_of_week: Mapped[int | None]
+
     reception_point_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("Reception_Point.id", ondelete="CASCADE")
     )
@@ -33,3 +56,26 @@ class WorkSchedule(Base):
     reception_point: Mapped["ReceptionPoint"] = relationship(
         back_populates="work_schedule"
     )
+
+    def update_minute_of_week(self) -> None:
+        if not isinstance(self.open_time, time) or not isinstance(
+            self.close_time, time
+        ):
+            self.open_minute_of_week = None
+            self.close_minute_of_week = None
+            return
+
+        day_of_week = enums.DayOfWeek(self.day_of_week)
+        open_minute: int = minute_of_week(day_of_week, self.open_time)
+        close_minute: int = minute_of_week(day_of_week, self.close_time)
+        if close_minute <= open_minute:
+            close_minute += MINUTES_PER_DAY
+
+        self.open_minute_of_week = open_minute
+        self.close_minute_of_week = close_minute
+
+
+@event.listens_for(WorkSchedule, "before_insert")
+@event.listens_for(WorkSchedule, "before_update")
+def _update_minute_of_week(_mapper, _connection, target: WorkSchedule) -> None:
+    target.update_minute_of_week()
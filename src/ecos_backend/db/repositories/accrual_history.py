@@ -1,4 +1,21 @@
 import abc
+import collections
+import datetime
+import typing
+import uuid
+
+from sqlalchemy import (
+    BigInteger,
+    Result,
+    Select,
+    Uuid,
+    column,
+    inspect,
+    select,
+    tuple_,
+    update,
+    values,
+)
 
 from ecos_backend.common.interfaces.repository import (
     AbstractRepository,
@@ -6,18 +23,97 @@ from ecos_backend.common.interfaces.repository import (
 )
 
 from ecos_backend.db.models.accrual_history import AccrualHistory
+from ecos_backend.db.models.user import User
 
 
 class AccrualHistoryAbstractReposity(AbstractRepository[AccrualHistory], abc.ABC):
-    # @abc.abstractmethod
-    # async def get_user_accrual_histories(
-    #     self, user_id: uuid.UUID, limit: int
-    # ) -> list[AccrualHistory]:
-    #     raise NotImplementedError()
-    pass
+    @abc.abstractmethod
+    async def get_user_accrual_histories(
+        self,
+        user_id: uuid.UUID,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+    ) -> list[AccrualHistory]:
+        raise NotImplementedError()
 
 
 class AccrualHistoryReposity(
     AbstractSqlRepository[AccrualHistory], AccrualHistoryAbstractReposity
 ):
-    pass
+    async def add(self, record: AccrualHistory) -> AccrualHistory:
+        """Adds the record and credits a new one to the user's points_total.
+
+        Both changes are part of the current transaction.
+        """
+        is_new: bool = not inspect(record).has_identity
+        record = await super().add(record)
+        if is_new and record.points:
+            await self._add_to_points_totals({record.user_id: record.points})
+        return record
+
+    async def add_many(self, rows: list[dict[str, typing.Any]]) -> None:
+        """Inserts the records and credits them to their users' points_total."""
+        await super().add_many(rows)
+
+        points: collections.Counter[uuid.UUID] = collections.Counter()
+        for row in rows:
+            points[row["user_id"]] += row.get("points") or 0
+        await self._add_to_points_totals(
+            {user_id: total for user_id, total in points.items() if total}
+        )
+
+    async def _add_to_points_totals(self, points: dict[uuid.UUID, int]) -> None:
+        """Credits every user with one UPDATE ... FROM (VALUES ...)."""
+        if not points:
+            return
+
+        totals = values(
+            column("user_id", Uuid), column("points", BigInteger), name="totals"
+        ).data(list(points.items()))
+        await self._session.execute(
+            update(User)
+            .where(User.id == totals.c.user_id)
+            .values(points_total=User.points_total + totals.c.points)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_user_accrual_histories(
+        self,
+        user_id: uuid.UUID,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+    ) -> list[AccrualHistory]:
+        stmt: Select = self._construct_get_user_accrual_histories_stmt(
+            user_id, limit=limit, after=after
+        )
+        result: Result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    def _construct_get_user_accrual_histories_stmt(
+        self,
+        user_id: uuid.UUID,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+    ) -> Select:
+        """Constructs a page of a user's history, newest first.
+
+        Rows are ordered by (created_at, id) descending, which is a backward
+        scan of ix_Accrual_History_user_id_created_at_id; after seeks past
+        that key.
+        """
+
+        model = self._model_cls
+        stmt: Select = (
+            select(model)
+            .where(model.user_id == user_id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit)
+        )
+
+        if after is not None:
+            stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(*after))
+
+        return stmt
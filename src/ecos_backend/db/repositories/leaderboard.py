@@ -0,0 +1,102 @@
+import abc
+import dataclasses
+import uuid
+
+from sqlalchemy import Result, Select, func, select, text
+
+from ecos_backend.common.interfaces.repository import (
+    AbstractRepository,
+    AbstractSqlRepository,
+)
+
+from ecos_backend.common import enums
+from ecos_backend.db.models.leaderboard import LeaderboardEntry
+from ecos_backend.db.models.user import User
+
+
+@dataclasses.dataclass
+class LeaderboardRow:
+    rank: int
+    user_id: uuid.UUID
+    points: int
+    first_name: str | None
+    last_name: str | None
+
+
+class LeaderboardAbstractReposity(AbstractRepository[LeaderboardEntry], abc.ABC):
+    @abc.abstractmethod
+    async def get_top(
+        self, period: enums.LeaderboardPeriod, *, limit: int
+    ) -> list[LeaderboardRow]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_user_entry(
+        self, period: enums.LeaderboardPeriod, user_id: uuid.UUID
+    ) -> LeaderboardEntry | None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def refresh(self) -> bool:
+        raise NotImplementedError()
+
+
+class LeaderboardReposity(
+    AbstractSqlRepository[LeaderboardEntry], LeaderboardAbstractReposity
+):
+    # pg advisory lock key held while the view is being refreshed
+    REFRESH_LOCK: int = 0x65636F74
+
+    async def get_top(
+        self, period: enums.LeaderboardPeriod, *, limit: int
+    ) -> list[LeaderboardRow]:
+        stmt: Select = self._construct_get_top_stmt(period, limit=limit)
+        result: Result = await self._session.execute(stmt)
+        return [LeaderboardRow(**row) for row in result.mappings()]
+
+    def _construct_get_top_stmt(
+        self, period: enums.LeaderboardPeriod, *, limit: int
+    ) -> Select:
+        """Constructs the first limit ranks of a period.
+
+        Served by ix_Leaderboard_period_rank_user_id; ties share a rank and
+        are ordered by user ID.
+        """
+
+        model = self._model_cls
+        return (
+            select(
+                model.rank,
+                model.user_id,
+                model.points,
+                User.first_name,
+                User.last_name,
+            )
+            .join(User, User.id == model.user_id)
+            .where(model.period == period)
+            .order_by(model.rank, model.user_id)
+            .limit(limit)
+        )
+
+    async def get_user_entry(
+        self, period: enums.LeaderboardPeriod, user_id: uuid.UUID
+    ) -> LeaderboardEntry | None:
+        """Looks the user's rank up through the (period, user_id) unique index."""
+        return await self._session.get(self._model_cls, (period, user_id))
+
+    async def refresh(self) -> bool:
+        """Recomputes the view without blocking readers.
+
+        Returns False when another session is already refreshing it.
+        """
+        locked: bool = await self._session.scalar(
+            select(func.pg_try_advisory_xact_lock(self.REFRESH_LOCK))
+        )
+        if not locked:
+            return False
+
+        view: str = self._model_cls.__tablename__
+        await self._session.execute(
+            text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY "{view}"')
+        )
+        return True
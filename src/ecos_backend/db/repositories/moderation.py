@@ -1,17 +1,105 @@
 import abc
+import dataclasses
+import datetime
+import typing
+import uuid
 
+from sqlalchemy import Result, Select, and_, select, tuple_
 
 from ecos_backend.common.interfaces.repository import (
     AbstractRepository,
     AbstractSqlRepository,
 )
 
+from ecos_backend.common import enums
 from ecos_backend.db.models.moderation import Moderation
+from ecos_backend.db.models.reception_point import ReceptionPoint
+
+
+@dataclasses.dataclass
+class ModerationRow:
+    """Moderation record with the reception point fields shown next to it."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    reception_point_id: uuid.UUID
+    verification_date: datetime.datetime
+    comment: str | None
+    reception_point_name: str
+    reception_point_status: enums.PointStatus
 
 
 class ModerationAbstractReposity(AbstractRepository[Moderation], abc.ABC):
-    pass
+    @abc.abstractmethod
+    async def get_list_rows(
+        self,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+        filters: dict[str, typing.Any] | None = None,
+    ) -> list[ModerationRow]:
+        raise NotImplementedError()
 
 
 class ModerationReposity(AbstractSqlRepository[Moderation], ModerationAbstractReposity):
-    pass
+    async def get_list_rows(
+        self,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+        filters: dict[str, typing.Any] | None = None,
+    ) -> list[ModerationRow]:
+        stmt: Select = self._construct_list_rows_stmt(
+            limit=limit, after=after, filters=filters
+        )
+        result: Result = await self._session.execute(stmt)
+        return [ModerationRow(**row) for row in result.mappings()]
+
+    def _construct_list_rows_stmt(
+        self,
+        *,
+        limit: int,
+        after: tuple[datetime.datetime, uuid.UUID] | None = None,
+        filters: dict[str, typing.Any] | None = None,
+    ) -> Select:
+        """Constructs a page of moderation records joined to their points.
+
+        Only the rendered columns are selected. Rows are ordered by
+        (verification_date, id), newest first; after seeks past that key.
+        """
+
+        model = self._model_cls
+        stmt: Select = (
+            select(
+                model.id,
+                model.user_id,
+                model.reception_point_id,
+                model.verification_date,
+                model.comment,
+                ReceptionPoint.name.label("reception_point_name"),
+                ReceptionPoint.status.label("reception_point_status"),
+            )
+            .join(ReceptionPoint, ReceptionPoint.id == model.reception_point_id)
+            .order_by(model.verification_date.desc(), model.id.desc())
+            .limit(limit)
+        )
+
+        where_clauses: list = self._construct_where_clauses(filters)
+        if where_clauses:
+            stmt = stmt.where(and_(*where_clauses))
+
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(model.verification_date, model.id) < tuple_(*after)
+            )
+
+        return stmt
+
+    def _construct_filter_clause(
+        self, column: str, operator: str | None, value: typing.Any
+    ) -> typing.Any:
+        # Moderation records keep no status of their own; "status" filters by
+        # the current status of the moderated point.
+        if column == "status":
+            return ReceptionPoint.status == value
+        return super()._construct_filter_clause(column, operator, value)
@@ -1,18 +1,94 @@
 import abc
+import dataclasses
+import datetime
+import typing
 import uuid
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    Result,
+    Select,
+    and_,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import Load, selectinload
 
 from ecos_backend.common.interfaces.repository import (
     AbstractRepository,
     AbstractSqlRepository,
 )
 
+from ecos_backend.common import enums
+from ecos_backend.db.models.reception_image import ReceptionImage
 from ecos_backend.db.models.reception_point import ReceptionPoint
+from ecos_backend.db.models.reception_point_waste import ReceptionPointWaste
 from ecos_backend.db.models.waste import Waste
+from ecos_backend.db.models.work_schedule import MINUTES_PER_WEEK, WorkSchedule
+
+
+@dataclasses.dataclass
+class ReceptionImageRow:
+    id: uuid.UUID
+    filename: str
+
+
+@dataclasses.dataclass
+class ReceptionPointRow:
+    """Lightweight, non-ORM reception point used by list projections."""
+
+    id: uuid.UUID
+    name: str
+    description: str | None
+    address: str
+    latitude: float | None
+    longitude: float | None
+    status: enums.PointStatus
+    user_id: uuid.UUID
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    reception_image: list[ReceptionImageRow] = dataclasses.field(default_factory=list)
+    waste: list[dict] = dataclasses.field(default_factory=list)
+    work_schedule: list[dict] = dataclasses.field(default_factory=list)
 
 
 class ReceptionPointAbstractReposity(AbstractRepository[ReceptionPoint], abc.ABC):
+    RELATIONS: typing.ClassVar[tuple[str, ...]] = ("images", "wastes", "schedule")
+
+    @abc.abstractmethod
+    async def get_list_rows(
+        self,
+        *,
+        limit: int,
+        include: typing.Collection[str] = RELATIONS,
+        offset: int | None = None,
+        after: tuple | None = None,
+        filters: dict[str, typing.Any] | None = None,
+    ) -> list[ReceptionPointRow]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_moderation_queue(
+        self,
+        *,
+        limit: int,
+        include: typing.Collection[str] = RELATIONS,
+        after: tuple | None = None,
+    ) -> list[ReceptionPointRow]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update_statuses(
+        self, statuses: dict[uuid.UUID, enums.PointStatus]
+    ) -> dict[uuid.UUID, uuid.UUID]:
+        raise NotImplementedError()
+
     @abc.abstractmethod
     async def add_waste_type(
         self, reception_point_id: uuid.UUID, waste_id: uuid.UUID
@@ -25,10 +101,332 @@ class ReceptionPointAbstractReposity(AbstractRepository[ReceptionPoint], abc.ABC
     ) -> ReceptionPoint:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    async def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        *,
+        limit: int,
+        waste_id: uuid.UUID | None = None,
+        after: tuple[float, uuid.UUID] | None = None,
+        options: list[Load] | None = None,
+    ) -> list[tuple[ReceptionPoint, float]]:
+        raise NotImplementedError()
+
 
 class ReceptionPointReposity(
     AbstractSqlRepository[ReceptionPoint], ReceptionPointAbstractReposity
 ):
+    async def get_list_rows(
+        self,
+        *,
+        limit: int,
+        include: typing.Collection[str] = ReceptionPointAbstractReposity.RELATIONS,
+        offset: int | None = None,
+        after: tuple | None = None,
+        filters: dict[str, typing.Any] | None = None,
+    ) -> list[ReceptionPointRow]:
+        stmt: Select = self._construct_list_rows_stmt(
+            limit=limit,
+            include=include,
+            offset=offset,
+            after=after,
+            filters=filters,
+        )
+        result: Result = await self._session.execute(stmt)
+        return [self._to_row(row) for row in result.mappings()]
+
+    def _construct_list_rows_stmt(
+        self,
+        *,
+        limit: int,
+        include: typing.Collection[str],
+        offset: int | None = None,
+        after: tuple | None = None,
+        filters: dict[str, typing.Any] | None = None,
+    ) -> Select:
+        """Constructs a single query returning points with aggregated relations.
+
+        Rows are ordered by (updated_at, id), newest first; after seeks past
+        that key.
+        """
+
+        model = self._model_cls
+        columns: list = self._construct_row_columns(include)
+
+        stmt: Select = select(*columns).order_by(
+            model.updated_at.desc(), model.id.desc()
+        )
+
+        where_clauses: list = self._construct_where_clauses(filters)
+        if where_clauses:
+            stmt = stmt.where(and_(*where_clauses))
+
+        if after is not None:
+            stmt = stmt.where(tuple_(model.updated_at, model.id) < tuple_(*after))
+
+        stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+
+        return stmt
+
+    def _construct_row_columns(self, include: typing.Collection[str]) -> list:
+        """Point columns plus the included relations aggregated to JSON.
+
+        Each included relation is a correlated json_agg subquery, so a page
+        costs one round-trip instead of one query per relationship.
+        """
+
+        model = self._model_cls
+        columns: list = [
+            model.id,
+            model.name,
+            model.description,
+            model.address,
+            model.latitude,
+            model.longitude,
+            model.status,
+            model.user_id,
+            model.created_at,
+            model.updated_at,
+        ]
+
+        if "images" in include:
+            columns.append(
+                select(
+                    self._json_agg(
+                        self._json_object(
+                            id=ReceptionImage.id, filename=ReceptionImage.filename
+                        )
+                    )
+                )
+                .where(ReceptionImage.reception_point_id == model.id)
+                .correlate(model)
+                .scalar_subquery()
+                .label("reception_image")
+            )
+        if "wastes" in include:
+            columns.append(
+                select(
+                    self._json_agg(
+                        self._json_object(
+                            id=Waste.id,
+                            name=Waste.name,
+                            abbreviated_name=Waste.abbreviated_name,
+                            image_url=Waste.image_url,
+                            description=Waste.description,
+                        )
+                    )
+                )
+                .select_from(Waste)
+                .join(ReceptionPointWaste, ReceptionPointWaste.waste_id == Waste.id)
+                .where(ReceptionPointWaste.reception_point_id == model.id)
+                .correlate(model)
+                .scalar_subquery()
+                .label("waste")
+            )
+        if "schedule" in include:
+            columns.append(
+                select(
+                    self._json_agg(
+                        self._json_object(
+                            id=WorkSchedule.id,
+                            day_of_week=WorkSchedule.day_of_week,
+                            open_time=WorkSchedule.open_time,
+                            close_time=WorkSchedule.close_time,
+                        )
+                    )
+                )
+                .where(WorkSchedule.reception_point_id == model.id)
+                .correlate(model)
+                .scalar_subquery()
+                .label("work_schedule")
+            )
+
+        return columns
+
+    async def get_moderation_queue(
+        self,
+        *,
+        limit: int,
+        include: typing.Collection[str] = ReceptionPointAbstractReposity.RELATIONS,
+        after: tuple | None = None,
+    ) -> list[ReceptionPointRow]:
+        stmt: Select = self._construct_moderation_queue_stmt(
+            limit=limit, include=include, after=after
+        )
+        result: Result = await self._session.execute(stmt)
+        return [self._to_row(row) for row in result.mappings()]
+
+    def _construct_moderation_queue_stmt(
+        self,
+        *,
+        limit: int,
+        include: typing.Collection[str],
+        after: tuple | None = None,
+    ) -> Select:
+        """Constructs a page of points awaiting moderation, oldest first.
+
+        Rows are ordered by (created_at, id), which is the order of the
+        partial index ix_Reception_Point_pending_created_at_id.
+        """
+
+        model = self._model_cls
+        stmt: Select = (
+            select(*self._construct_row_columns(include))
+            # A literal, not a bind parameter: a generic plan for
+            # "status = $1" cannot use the partial index.
+            .where(text("status = 'UNDER_MODERATION'"))
+            .order_by(model.created_at, model.id)
+            .limit(limit)
+        )
+
+        if after is not None:
+            stmt = stmt.where(tuple_(model.created_at, model.id) > tuple_(*after))
+
+        return stmt
+
+    @staticmethod
+    def _json_object(**fields: typing.Any) -> typing.Any:
+        arguments: list = []
+        for key, value in fields.items():
+            arguments.extend([literal_column(f"'{key}'"), value])
+        return func.json_build_object(*arguments)
+
+    @staticmethod
+    def _json_agg(json_object: typing.Any) -> typing.Any:
+        """Aggregates JSON objects into an array, empty when there are no rows."""
+        return func.coalesce(func.json_agg(json_object), text("'[]'::json"), type_=JSON)
+
+    @staticmethod
+    def _to_row(row: typing.Mapping) -> ReceptionPointRow:
+        data: dict = dict(row)
+        data["reception_image"] = [
+            ReceptionImageRow(id=uuid.UUID(image["id"]), filename=image["filename"])
+            for image in data.get("reception_image") or []
+        ]
+        data["work_schedule"] = [
+            {**schedule, "day_of_week": enums.DayOfWeek[schedule["day_of_week"]]}
+            for schedule in data.get("work_schedule") or []
+        ]
+        data["waste"] = data.get("waste") or []
+        return ReceptionPointRow(**data)
+
+    def _construct_filter_clause(
+        self, column: str, operator: str | None, value: typing.Any
+    ) -> typing.Any:
+        # "open_at" takes a minute of week and matches points open at that time.
+        if column == "open_at":
+            return self._construct_open_at_clause(value)
+        return super()._construct_filter_clause(column, operator, value)
+
+    def _construct_open_at_clause(self, minute: int) -> typing.Any:
+        # Intervals running past Sunday midnight are matched by shifting the
+        # minute one week forward.
+        return exists().where(
+            WorkSchedule.reception_point_id == self._model_cls.id,
+            or_(
+                and_(
+                    WorkSchedule.open_minute_of_week <= minute,
+                    WorkSchedule.close_minute_of_week > minute,
+                ),
+                and_(
+                    WorkSchedule.open_minute_of_week <= minute + MINUTES_PER_WEEK,
+                    WorkSchedule.close_minute_of_week > minute + MINUTES_PER_WEEK,
+                ),
+            ),
+        )
+
+    async def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        *,
+        limit: int,
+        waste_id: uuid.UUID | None = None,
+        after: tuple[float, uuid.UUID] | None = None,
+        options: list[Load] | None = None,
+    ) -> list[tuple[ReceptionPoint, float]]:
+        stmt: Select = self._construct_get_nearby_stmt(
+            latitude,
+            longitude,
+            radius,
+            limit=limit,
+            waste_id=waste_id,
+            after=after,
+            options=options,
+        )
+        result: Result = await self._session.execute(stmt)
+        return [(point, distance) for point, distance in result.all()]
+
+    def _construct_get_nearby_stmt(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        *,
+        limit: int,
+        waste_id: uuid.UUID | None = None,
+        after: tuple[float, uuid.UUID] | None = None,
+        options: list[Load] | None = None,
+    ) -> Select:
+        """Constructs a distance-ordered search within radius meters.
+
+        The earth_box containment check is served by the GiST index on
+        ll_to_earth(latitude, longitude); earth_distance then trims the box
+        corners and orders the result.
+        """
+
+        origin = func.ll_to_earth(latitude, longitude)
+        location = func.ll_to_earth(self._model_cls.latitude, self._model_cls.longitude)
+        distance = func.earth_distance(origin, location)
+
+        stmt: Select[tuple[ReceptionPoint, float]] = (
+            select(self._model_cls, distance.label("distance"))
+            .where(func.earth_box(origin, radius).op("@>")(location))
+            .where(distance <= radius)
+            .order_by(distance, self._model_cls.id)
+            .limit(limit)
+        )
+
+        if waste_id is not None:
+            stmt = stmt.where(self._model_cls.waste.any(Waste.id == waste_id))
+
+        if after is not None:
+            stmt = stmt.where(tuple_(distance, self._model_cls.id) > tuple_(*after))
+
+        if options:
+            stmt = stmt.options(*options)
+
+        return stmt
+
+    async def update_statuses(
+        self, statuses: dict[uuid.UUID, enums.PointStatus]
+    ) -> dict[uuid.UUID, uuid.UUID]:
+        """Sets the status of many points, one UPDATE per distinct status.
+
+        Returns the owner ID of each updated point; missing IDs are absent.
+        """
+        ids_by_status: dict[enums.PointStatus, list[uuid.UUID]] = {}
+        for reception_point_id, status in statuses.items():
+            ids_by_status.setdefault(status, []).append(reception_point_id)
+
+        owners: dict[uuid.UUID, uuid.UUID] = {}
+        for status, ids in ids_by_status.items():
+            result: Result = await self._session.execute(
+                update(self._model_cls)
+                .where(self._model_cls.id.in_(ids))
+                .values(status=status)
+                .returning(self._model_cls.id, self._model_cls.user_id)
+                .execution_options(synchronize_session=False)
+            )
+            owners.update(result.tuples().all())
+        return owners
+
     async def add_waste_type(
         self, reception_point_id: uuid.UUID, waste_id: uuid.UUID
     ) -> ReceptionPoint:
@@ -0,0 +1,49 @@
+import abc
+
+from sqlalchemy import Result, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ecos_backend.common.interfaces.repository import (
+    AbstractRepository,
+    AbstractSqlRepository,
+)
+
+from ecos_backend.db.models.table_version import TableVersion
+
+
+class TableVersionAbstractReposity(AbstractRepository[TableVersion], abc.ABC):
+    @abc.abstractmethod
+    async def get_versions(self, names: list[str]) -> dict[str, int]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def bump(self, *names: str) -> None:
+        raise NotImplementedError()
+
+
+class TableVersionReposity(
+    AbstractSqlRepository[TableVersion], TableVersionAbstractReposity
+):
+    async def get_versions(self, names: list[str]) -> dict[str, int]:
+        """Returns the version of each table, 0 for tables never written."""
+        result: Result = await self._session.execute(
+            select(self._model_cls.name, self._model_cls.version).where(
+                self._model_cls.name.in_(names)
+            )
+        )
+        versions: dict[str, int] = dict(result.tuples().all())
+        return {name: versions.get(name, 0) for name in names}
+
+    async def bump(self, *names: str) -> None:
+        """Increments the versions as part of the current transaction.
+
+        The new versions become visible together with the data they describe.
+        """
+        stmt = insert(self._model_cls).values(
+            [{"name": name, "version": 1} for name in sorted(set(names))]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self._model_cls.name],
+            set_={"version": self._model_cls.version + 1},
+        )
+        await self._session.execute(stmt)
@@ -1,6 +1,8 @@
 import abc
+import typing
+import uuid
 
-from sqlalchemy import Result, Select, func, select
+from sqlalchemy import Result, Select, func, select, update
 from sqlalchemy.orm import joinedload
 
 from ecos_backend.common.interfaces.repository import (
@@ -9,6 +11,7 @@ from ecos_backend.common.interfaces.repository import (
     AbstractSqlRepository,
 )
 
+from ecos_backend.db.models.accrual_history import AccrualHistory
 from ecos_backend.db.models.user import User
 
 
@@ -23,8 +26,15 @@ class UserAbstractReposity(AbstractRepository[User], abc.ABC):
     ) -> User | None:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    async def reconcile_points_totals(self) -> list[uuid.UUID] | None:
+        raise NotImplementedError()
+
 
 class UserReposity(AbstractSqlRepository[User], UserAbstractReposity):
+    # pg advisory lock key held while points totals are being reconciled
+    POINTS_RECONCILIATION_LOCK: int = 0x65636F73
+
     async def get_by_verification_code(self, verification_code: str) -> T | None:
         stmt: Select = self._construct_get_by_verification_code_stmt(verification_code)
         result: Result = await self._session.execute(stmt)
@@ -56,3 +66,65 @@ class UserReposity(AbstractSqlRepository[User], UserAbstractReposity):
             stmt = stmt.options(joinedload(self._model_cls.user_image))
 
         return stmt
+
+    async def reconcile_points_totals(self) -> list[uuid.UUID] | None:
+        """Resets points_total to the accrual history sum where they differ.
+
+        Returns the IDs of corrected users, or None when another session is
+        already reconciling. The lock is released when the transaction ends.
+
+        Drifted users are locked first and only then recomputed. The UPDATE
+        runs with a snapshot taken after the locks were granted, so it sees
+        every credit committed before them. Credits that are still open wait
+        for the locks and apply their increment on top of the repaired
+        total.
+        """
+        locked: bool = await self._session.scalar(
+            select(func.pg_try_advisory_xact_lock(self.POINTS_RECONCILIATION_LOCK))
+        )
+        if not locked:
+            return None
+
+        result: Result = await self._session.execute(
+            self._construct_lock_drifted_points_totals_stmt()
+        )
+        user_ids: list[uuid.UUID] = list(result.scalars().all())
+        if not user_ids:
+            return []
+
+        result = await self._session.execute(
+            self._construct_reconcile_points_totals_stmt(user_ids)
+        )
+        return list(result.scalars().all())
+
+    def _construct_expected_points_total(self) -> typing.Any:
+        return (
+            select(func.coalesce(func.sum(AccrualHistory.points), 0))
+            .where(AccrualHistory.user_id == self._model_cls.id)
+            .scalar_subquery()
+        )
+
+    def _construct_lock_drifted_points_totals_stmt(self) -> Select:
+        return (
+            select(self._model_cls.id)
+            .where(
+                self._model_cls.points_total.is_distinct_from(
+                    self._construct_expected_points_total()
+                )
+            )
+            .order_by(self._model_cls.id)
+            .with_for_update()
+        )
+
+    def _construct_reconcile_points_totals_stmt(
+        self, user_ids: list[uuid.UUID]
+    ) -> typing.Any:
+        expected = self._construct_expected_points_total()
+        return (
+            update(self._model_cls)
+            .where(self._model_cls.id.in_(user_ids))
+            .where(self._model_cls.points_total.is_distinct_from(expected))
+            .values(points_total=expected)
+            .returning(self._model_cls.id)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,16 +1,102 @@
+import asyncio
+import functools
 import io
 import pathlib
 import typing
 
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 import botocore
 
 from urllib.parse import ParseResult, urlparse
 
 from ecos_backend.common import config
+from ecos_backend.common.cache import CacheStats, TTLCache
+
+
+def public_endpoint(endpoint: str, domain: str | None) -> str:
+    """Endpoint with its host name replaced by the public domain.
+
+    The scheme, port and path are kept; only the host part changes.
+    """
+    if not domain:
+        return endpoint
+
+    parsed_url: ParseResult = urlparse(endpoint)
+    netloc: str = domain if parsed_url.port is None else f"{domain}:{parsed_url.port}"
+    return parsed_url._replace(netloc=netloc).geturl()
+
+
+class PresignedURLSigner:
+    """Generates presigned GET URLs locally, without calling S3.
+
+    The signer owns a long-lived client pointed at the public endpoint, so
+    the signed host is the one clients request and no rewriting is needed.
+    Each URL is cached until refresh_margin seconds before it expires.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        access_key: str,
+        secret_key: str,
+        *,
+        expires_in: int = 3600,
+        refresh_margin: int = 300,
+        cache_size: int = 10000,
+    ) -> None:
+        self._endpoint: str = endpoint
+        self._access_key: str = access_key
+        self._secret_key: str = secret_key
+        self._expires_in: int = expires_in
+        self._cache: TTLCache[tuple[str, str], str] = TTLCache(
+            max_entries=cache_size, ttl=max(expires_in - refresh_margin, 0)
+        )
+        self._client: typing.Any | None = None
+
+    @property
+    def client(self) -> typing.Any:
+        if self._client is None:
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=self._endpoint,
+                aws_access_key_id=self._access_key,
+                aws_secret_access_key=self._secret_key,
+                config=botocore.client.Config(signature_version="s3v4"),
+            )
+        return self._client
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def sign(self, bucket_name: str, key: str) -> str:
+        return self.sign_many(bucket_name, [key])[0]
+
+    def sign_many(self, bucket_name: str, keys: typing.Sequence[str]) -> list[str]:
+        urls: list[str] = []
+        for key in keys:
+            url: str | None = self._cache.get((bucket_name, key))
+            if url is None:
+                url = self.client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": bucket_name, "Key": key},
+                    ExpiresIn=self._expires_in,
+                )
+                self._cache.set((bucket_name, key), url)
+            urls.append(url)
+        return urls
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
 
 class Boto3DAO:
+    DELETE_BATCH_SIZE: int = 1000
+
     def __init__(
         self,
         domain: str,
@@ -18,52 +104,119 @@ class Boto3DAO:
         endpoint: str,
         access_key: str,
         secret_key: str,
+        max_pool_connections: int = 10,
+        thread_pool_size: int = 10,
+        presigned_url_expires_in: int = 3600,
+        presigned_url_refresh_margin: int = 300,
+        presigned_url_cache_size: int = 10000,
     ) -> None:
         self._domain: str = domain
         self._bucket_names: dict[str] = bucket_names
         self._endpoint: str = endpoint
         self._access_key: str = access_key
         self._secret_key: str = secret_key
+        self._max_pool_connections: int = max_pool_connections
+        self._thread_pool_size: int = thread_pool_size
+
+        self._client: typing.Any | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._signer: PresignedURLSigner = PresignedURLSigner(
+            endpoint=public_endpoint(endpoint, domain),
+            access_key=access_key,
+            secret_key=secret_key,
+            expires_in=presigned_url_expires_in,
+            refresh_margin=presigned_url_refresh_margin,
+            cache_size=presigned_url_cache_size,
+        )
 
-    def _create_s3_client(self) -> boto3.client:
-        client = boto3.client(
+    def start(self) -> None:
+        """Creates the process-wide S3 client and its worker pool."""
+        if self._client is not None:
+            return
+
+        self._client = boto3.client(
             "s3",
             endpoint_url=self._endpoint,
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
-            config=botocore.client.Config(signature_version="s3v4"),
+            config=botocore.client.Config(
+                signature_version="s3v4",
+                max_pool_connections=self._max_pool_connections,
+            ),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._thread_pool_size, thread_name_prefix="s3"
         )
-        return client
 
-    def upload_object(
+    def close(self) -> None:
+        """Waits for in-flight calls and releases pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        self._signer.close()
+
+    @property
+    def signer(self) -> PresignedURLSigner:
+        return self._signer
+
+    @property
+    def client(self) -> typing.Any:
+        if self._client is None:
+            self.start()
+        return self._client
+
+    async def _run(self, func: typing.Callable, *args, **kwargs) -> typing.Any:
+        """Runs a blocking boto3 call on the bounded worker pool."""
+        client = self.client
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, client, *args, **kwargs)
+        )
+
+    async def upload_object(
         self,
         bucket_name: str,
         prefix: str,
         source_file_name: str,
-        content: str | bytes,
-    ) -> typing.Any:
-        client = self._create_s3_client()
+        content: str | bytes | typing.BinaryIO,
+    ) -> str:
+        """Uploads an object and returns a presigned GET URL for it."""
+        destination_path: str = await self._run(
+            self._upload_object, bucket_name, prefix, source_file_name, content
+        )
+        return self._signer.sign(self._bucket_names[bucket_name], destination_path)
+
+    def _upload_object(
+        self,
+        client: typing.Any,
+        bucket_name: str,
+        prefix: str,
+        source_file_name: str,
+        content: str | bytes | typing.BinaryIO,
+    ) -> str:
         destination_path = str(pathlib.Path(prefix, source_file_name))
 
+        # upload_fileobj switches to a multipart upload for large files and
+        # aborts it if any part fails.
         if isinstance(content, bytes):
             buffer = io.BytesIO(content)
-        else:
+        elif isinstance(content, str):
             buffer = io.BytesIO(content.encode("utf-8"))
+        else:
+            buffer = content
+            buffer.seek(0)
         client.upload_fileobj(buffer, self._bucket_names[bucket_name], destination_path)
+        return destination_path
 
-        url = client.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": f"{self._bucket_names[bucket_name]}",
-                "Key": f"{destination_path}",
-            },
-            ExpiresIn=3600,
-        )
-        return url.replace("minio", self._domain)
-
-    def get_objects(self, bucket_name: str, prefix: str) -> list[str]:
-        client = self._create_s3_client()
+    async def get_objects(self, bucket_name: str, prefix: str) -> list[str]:
+        return await self._run(self._get_objects, bucket_name, prefix)
 
+    def _get_objects(
+        self, client: typing.Any, bucket_name: str, prefix: str
+    ) -> list[str]:
         prefix = self._clean_prefix(bucket_name=bucket_name, prefix=prefix)
 
         response = client.list_objects_v2(
@@ -81,14 +234,55 @@ class Boto3DAO:
 
         return storage_content
 
-    def delete_object(
+    async def delete_object(
         self, bucket_name: str, prefix: str, source_file_name: str
     ) -> None:
-        client = self._create_s3_client()
+        await self._run(self._delete_object, bucket_name, prefix, source_file_name)
+
+    def _delete_object(
+        self,
+        client: typing.Any,
+        bucket_name: str,
+        prefix: str,
+        source_file_name: str,
+    ) -> None:
         prefix = self._clean_prefix(bucket_name=bucket_name, prefix=prefix)
         path_to_file = str(pathlib.Path(prefix, source_file_name))
         client.delete_object(Bucket=self._bucket_names[bucket_name], Key=path_to_file)
 
+    async def delete_objects(
+        self, bucket_name: str, prefix: str, source_file_names: list[str]
+    ) -> None:
+        """Deletes many objects with multi-object delete, up to 1000 keys per call."""
+        prefix = self._clean_prefix(bucket_name=bucket_name, prefix=prefix)
+        keys: list[str] = [
+            str(pathlib.Path(prefix, file_name)) for file_name in source_file_names
+        ]
+
+        await asyncio.gather(
+            *(
+                self._run(
+                    self._delete_objects_batch,
+                    bucket_name,
+                    keys[i : i + self.DELETE_BATCH_SIZE],
+                )
+                for i in range(0, len(keys), self.DELETE_BATCH_SIZE)
+            )
+        )
+
+    def _delete_objects_batch(
+        self, client: typing.Any, bucket_name: str, keys: list[str]
+    ) -> None:
+        response = client.delete_objects(
+            Bucket=self._bucket_names[bucket_name],
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+
+        errors: list[dict] = response.get("Errors", [])
+        if errors:
+            failed: str = ", ".join(error["Key"] for error in errors)
+            raise RuntimeError(f"Failed to delete objects: {failed}")
+
     def __call__(self) -> "Boto3DAO":
         """Allows the class instance to be used as a dependency."""
         return self
@@ -110,4 +304,9 @@ def s3_bucket_factory(config: config.S3Config) -> Boto3DAO:
         endpoint=config.ENDPOINT,
         access_key=config.ACCESS_KEY,
         secret_key=config.SECRET_KEY,
+        max_pool_connections=config.MAX_POOL_CONNECTIONS,
+        thread_pool_size=config.THREAD_POOL_SIZE,
+        presigned_url_expires_in=config.PRESIGNED_URL_EXPIRES_IN,
+        presigned_url_refresh_margin=config.PRESIGNED_URL_REFRESH_MARGIN,
+        presigned_url_cache_size=config.PRESIGNED_URL_CACHE_SIZE,
     )
@@ -1,44 +1,74 @@
-# import uuid
-
-
-# from ecos_backend.models.accrual_history import AccrualHistoryDTO
-
-# from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
-
-
-# class AccrualHistoryService:
-#     def __init__(
-#         self,
-#         uow: AbstractUnitOfWork,
-#     ) -> None:
-#         self._uow: AbstractUnitOfWork = uow
-
-#     async def get_user_accrual_histories(
-#         self, user_id: uuid.UUID, limit: int = 100
-#     ) -> list[AccrualHistoryDTO]:
-#         async with self._uow:
-#             accrual_histories: list[
-#                 AccrualHistoryDTO
-#             ] = await self._uow.accrual_history.get_user_accrual_histories(
-#                 user_id=user_id,
-#                 limit=limit,
-#             )
-#             return accrual_histories
-
-#     async def get_accrual_histories(
-#         self, filters: str | None = None
-#     ) -> list[AccrualHistoryDTO]:
-#         async with self._uow:
-#             accrual_histories: list[
-#                 AccrualHistoryDTO
-#             ] = await self._uow.accrual_history.get_all(filters=filters)
-#             return accrual_histories
-
-#     async def get_accrual_history_by_id(
-#         self, id: uuid.UUID
-#     ) -> AccrualHistoryDTO | None:
-#         async with self._uow:
-#             accrual_history: (
-#                 AccrualHistoryDTO | None
-#             ) = await self._uow.accrual_history.get_by_id(id=id)
-#             return accrual_history
+import dataclasses
+import uuid
+
+from datetime import datetime
+
+from ecos_backend.common.cache import Cache
+from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
+from ecos_backend.common import exception as exc
+from ecos_backend.common.pagination import decode_cursor, encode_cursor
+from ecos_backend.db.models.accrual_history import AccrualHistory
+from ecos_backend.service.user import UserService
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class AccrualHistoryService:
+    uow: AbstractUnitOfWork
+    cache: Cache
+
+    async def get_user_accrual_histories(
+        self,
+        user_id: uuid.UUID,
+        per_page: int = 20,
+        cursor: str | None = None,
+    ) -> tuple[list[AccrualHistory], str | None]:
+        """Get a page of the user's accrual history with the next cursor.
+
+        Pages are ordered by (created_at, id), newest first.
+        """
+        after: tuple | None = (
+            decode_cursor(cursor, [datetime.fromisoformat, uuid.UUID])
+            if cursor is not None
+            else None
+        )
+
+        async with self.uow:
+            try:
+                # One extra row tells whether there is a next page.
+                records: list[
+                    AccrualHistory
+                ] = await self.uow.accrual_history.get_user_accrual_histories(
+                    user_id, limit=per_page + 1, after=after
+                )
+
+                next_cursor: str | None = None
+                if len(records) > per_page:
+                    records = records[:per_page]
+                    next_cursor = encode_cursor(records[-1].created_at, records[-1].id)
+
+                return records, next_cursor
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get accrual history: {str(e)}"
+                )
+
+    async def reconcile_points_totals(self) -> list[uuid.UUID]:
+        """Repair user balances that drifted from their accrual history."""
+        async with self.uow:
+            try:
+                user_ids: (
+                    list[uuid.UUID] | None
+                ) = await self.uow.user.reconcile_points_totals()
+                await self.uow.commit()
+            except Exception as e:
+                await self.uow.rollback()
+                raise exc.InternalServerException(
+                    detail=f"Failed to reconcile points totals: {str(e)}"
+                )
+
+        # None means another worker holds the reconciliation lock.
+        if user_ids:
+            await self.cache.invalidate_tags(
+                *(UserService.cache_key(user_id) for user_id in user_ids)
+            )
+        return user_ids or []
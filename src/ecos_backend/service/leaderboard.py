@@ -0,0 +1,62 @@
+import dataclasses
+import typing
+import uuid
+
+from ecos_backend.common.cache import Cache
+from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
+from ecos_backend.common import enums, exception as exc
+from ecos_backend.db.models.leaderboard import LeaderboardEntry
+from ecos_backend.db.repositories.leaderboard import LeaderboardRow
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class LeaderboardService:
+    uow: AbstractUnitOfWork
+    cache: Cache
+
+    # Tag of every cached leaderboard page, dropped after each refresh.
+    CACHE_TAG: typing.ClassVar[str] = LeaderboardEntry.__tablename__
+
+    @staticmethod
+    def cache_key(period: enums.LeaderboardPeriod, limit: int) -> str:
+        return f"leaderboard:{period.name}:{limit}"
+
+    async def get_leaderboard(
+        self, period: enums.LeaderboardPeriod, limit: int = 10
+    ) -> list[LeaderboardRow]:
+        """Get the top users of the period as of the last refresh."""
+        async with self.uow:
+            try:
+                return await self.uow.leaderboard.get_top(period, limit=limit)
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get leaderboard: {str(e)}"
+                )
+
+    async def get_user_rank(
+        self, period: enums.LeaderboardPeriod, user_id: uuid.UUID
+    ) -> LeaderboardEntry | None:
+        """Get the user's rank in the period, None if they have no points in it."""
+        async with self.uow:
+            try:
+                return await self.uow.leaderboard.get_user_entry(period, user_id)
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get leaderboard rank: {str(e)}"
+                )
+
+    async def refresh(self) -> bool:
+        """Recompute the rankings; False if another worker is already doing it."""
+        async with self.uow:
+            try:
+                refreshed: bool = await self.uow.leaderboard.refresh()
+                await self.uow.commit()
+            except Exception as e:
+                await self.uow.rollback()
+                raise exc.InternalServerException(
+                    detail=f"Failed to refresh leaderboard: {str(e)}"
+                )
+
+        if refreshed:
+            await self.cache.invalidate_tags(self.CACHE_TAG)
+        return refreshed
@@ -1,24 +1,110 @@
 import dataclasses
+import typing
+import uuid
 
-from sqlalchemy.orm import selectinload
-
-from ecos_backend.db.models.moderation import Moderation
+from datetime import datetime
 
 from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
+from ecos_backend.common import exception as exc
+from ecos_backend.common.pagination import decode_cursor, encode_cursor
+from ecos_backend.db.repositories.moderation import ModerationRow
+from ecos_backend.db.repositories.reception_point import (
+    ReceptionPointAbstractReposity,
+    ReceptionPointRow,
+)
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
 class ModerationService:
     uow: AbstractUnitOfWork
 
-    async def get_moderations(self, filters: str | None = None) -> list[Moderation]:
+    # ModerationFilterParams field -> repository filter key
+    FILTERS: typing.ClassVar[dict[str, str]] = {
+        "reception_point_id": "reception_point_id",
+        "user_id": "user_id",
+        "status": "status",
+        "verified_after": "verification_date__gte",
+        "verified_before": "verification_date__lte",
+    }
+
+    async def get_moderations(
+        self,
+        filters: dict | None = None,
+        per_page: int = 20,
+        cursor: str | None = None,
+    ) -> tuple[list[ModerationRow], str | None]:
+        """Get a page of moderation records with the next cursor.
+
+        Pages are ordered by (verification_date, id), newest first.
+        """
+        filters = self._build_filters(filters)
+        after: tuple | None = (
+            decode_cursor(cursor, [datetime.fromisoformat, uuid.UUID])
+            if cursor is not None
+            else None
+        )
+
+        async with self.uow:
+            try:
+                # One extra row tells whether there is a next page.
+                moderations: list[
+                    ModerationRow
+                ] = await self.uow.moderation.get_list_rows(
+                    limit=per_page + 1, after=after, filters=filters
+                )
+
+                next_cursor: str | None = None
+                if len(moderations) > per_page:
+                    moderations = moderations[:per_page]
+                    next_cursor = encode_cursor(
+                        moderations[-1].verification_date, moderations[-1].id
+                    )
+
+                return moderations, next_cursor
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get moderations: {str(e)}"
+                )
+
+    async def get_queue(
+        self,
+        per_page: int = 20,
+        cursor: str | None = None,
+        include: typing.Collection[str] | None = None,
+    ) -> tuple[list[ReceptionPointRow], str | None]:
+        """Get a page of reception points awaiting moderation, oldest first."""
+        if include is None:
+            include = ReceptionPointAbstractReposity.RELATIONS
+        after: tuple | None = (
+            decode_cursor(cursor, [datetime.fromisoformat, uuid.UUID])
+            if cursor is not None
+            else None
+        )
+
         async with self.uow:
-            options: list = []
-            options.append(selectinload(Moderation.user))
-            options.append(selectinload(Moderation.reception_point))
-
-            moderations: list[Moderation] = await self.uow.moderation.get_all(
-                filters=filters,
-                options=options,
-            )
-            return moderations
+            try:
+                points: list[
+                    ReceptionPointRow
+                ] = await self.uow.reception_point.get_moderation_queue(
+                    limit=per_page + 1, include=include, after=after
+                )
+
+                next_cursor: str | None = None
+                if len(points) > per_page:
+                    points = points[:per_page]
+                    next_cursor = encode_cursor(points[-1].created_at, points[-1].id)
+
+                return points, next_cursor
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get moderation queue: {str(e)}"
+                )
+
+    def _build_filters(self, filters: dict | None) -> dict:
+        """Translate filter parameters into repository filter keys."""
+        built: dict = {}
+        for name, value in (filters or {}).items():
+            if name not in self.FILTERS:
+                raise exc.BadRequestException(detail=f"Unknown filter: {name}")
+            built[self.FILTERS[name]] = value
+        return built
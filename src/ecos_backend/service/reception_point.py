@@ -1,33 +1,87 @@
+import asyncio
+import json
+import typing
 import uuid
 import dataclasses
 
+from datetime import datetime
+from zoneinfo import ZoneInfo
 
 from sqlalchemy.orm import selectinload
 
 from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
-from ecos_backend.common.config import s3_config
+from ecos_backend.common.cache import Cache
+from ecos_backend.common.config import s3_config, schedule_config
 from ecos_backend.common import exception as exc
 from ecos_backend.common import enums
+from ecos_backend.common.pagination import decode_cursor, encode_cursor
 
-from ecos_backend.db.models.accrual_history import AccrualHistory
-from ecos_backend.db.models.moderation import Moderation
 from ecos_backend.db.models.reception_image import ReceptionImage
 from ecos_backend.db.models.reception_point import ReceptionPoint
-from ecos_backend.db.models.work_schedule import WorkSchedule
+from ecos_backend.db.models.work_schedule import WorkSchedule, minute_of_week
+from ecos_backend.db.repositories.reception_point import (
+    ReceptionPointAbstractReposity,
+    ReceptionPointRow,
+)
 
 from ecos_backend.db.s3_storage import Boto3DAO
+from ecos_backend.service.user import UserService
+from ecos_backend.service.waste import WasteService
+
+
+@dataclasses.dataclass
+class StatusUpdate:
+    reception_point_id: uuid.UUID
+    status: enums.PointStatus
+    comment: str | None = None
+
+
+@dataclasses.dataclass
+class StatusUpdateOutcome:
+    reception_point_id: uuid.UUID
+    status: enums.Status
+    detail: str | None = None
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
 class ReceptionPointService:
     uow: AbstractUnitOfWork
     s3_storage: Boto3DAO
+    cache: Cache
+
+    # Tag of cached values that depend on every reception point.
+    CACHE_TAG: typing.ClassVar[str] = ReceptionPoint.__tablename__
+
+    # ReceptionPointFilterParams field -> repository filter key
+    FILTERS: typing.ClassVar[dict[str, str]] = {
+        "name": "name__ilike",
+        "address": "address__ilike",
+        "status": "status",
+        "waste_type": "waste__any",
+        "user_id": "user_id",
+        "created_after": "created_at__gte",
+        "created_before": "created_at__lte",
+        "open_at": "open_at",
+    }
+
+    @staticmethod
+    def cache_key(reception_point_id: uuid.UUID) -> str:
+        """Cache key of a reception point detail, also used as its tag."""
+        return f"reception_point:{reception_point_id}"
+
+    @staticmethod
+    def count_cache_key(filters: dict) -> str:
+        """Cache key of the number of reception points matching filters."""
+        return "reception_point:count:" + json.dumps(
+            filters, sort_keys=True, default=str
+        )
 
     async def add_reception_point(
         self,
         reception_point: ReceptionPoint,
         work_schedule: list,
-        uploaded_files: list[tuple[str, bytes, str]],  # (filename, content, extension)
+        # (filename, content, extension)
+        uploaded_files: list[tuple[str, typing.BinaryIO, str]],
     ) -> ReceptionPoint:
         """Add new reception point with uploaded images."""
         async with self.uow:
@@ -64,7 +118,9 @@ class ReceptionPointService:
                     )
                     await self.uow.reception_image.add(reception_image)
 
+                await self.uow.table_version.bump(ReceptionPoint.__tablename__)
                 await self.uow.commit()
+                await self.cache.invalidate_tags(self.CACHE_TAG)
                 return reception_point
 
             except Exception as e:
@@ -87,7 +143,11 @@ class ReceptionPointService:
                 await self.uow.reception_point.add_waste_type(
                     reception_point_id=reception_point_id, waste_id=waste_id
                 )
+                await self.uow.table_version.bump(ReceptionPoint.__tablename__)
                 await self.uow.commit()
+                await self.cache.invalidate_tags(
+                    self.cache_key(reception_point_id), self.CACHE_TAG
+                )
             except Exception as e:
                 await self.uow.rollback()
                 raise exc.InternalServerException(
@@ -105,7 +165,11 @@ class ReceptionPointService:
                 await self.uow.reception_point.delete_waste_type(
                     reception_point_id=reception_point_id, waste_id=waste_id
                 )
+                await self.uow.table_version.bump(ReceptionPoint.__tablename__)
                 await self.uow.commit()
+                await self.cache.invalidate_tags(
+                    self.cache_key(reception_point_id), self.CACHE_TAG
+                )
             except Exception as e:
                 await self.uow.rollback()
                 raise exc.InternalServerException(
@@ -117,8 +181,86 @@ class ReceptionPointService:
         filters: dict | None = None,
         page: int = 1,
         per_page: int = 10,
-    ) -> list[ReceptionPoint]:
-        """Get list of reception points with their images."""
+        cursor: str | None = None,
+        include: typing.Collection[str] | None = None,
+    ) -> tuple[list[ReceptionPointRow], int, str | None]:
+        """Get a page of reception points with the total count and next cursor.
+
+        Pages are ordered by (updated_at, id), newest first. When a cursor is
+        given it replaces the page number and the page is fetched by keyset.
+        include limits the related collections loaded; None loads them all.
+        """
+        filters = self._build_filters(filters)
+        if include is None:
+            include = ReceptionPointAbstractReposity.RELATIONS
+
+        async with self.uow:
+            try:
+                # One extra row tells whether there is a next page.
+                if cursor is not None:
+                    after: tuple = decode_cursor(
+                        cursor, [datetime.fromisoformat, uuid.UUID]
+                    )
+                    points: list[
+                        ReceptionPointRow
+                    ] = await self.uow.reception_point.get_list_rows(
+                        limit=per_page + 1,
+                        include=include,
+                        after=after,
+                        filters=filters,
+                    )
+                else:
+                    points = await self.uow.reception_point.get_list_rows(
+                        limit=per_page + 1,
+                        include=include,
+                        offset=(page - 1) * per_page,
+                        filters=filters,
+                    )
+
+                total: int = await self._count_reception_points(filters)
+
+                next_cursor: str | None = None
+                if len(points) > per_page:
+                    points = points[:per_page]
+                    next_cursor = encode_cursor(points[-1].updated_at, points[-1].id)
+
+                return points, total, next_cursor
+            except exc.BadRequestException:
+                raise
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get reception points: {str(e)}"
+                )
+
+    async def _count_reception_points(self, filters: dict) -> int:
+        """Count reception points matching filters, caching the total.
+
+        Every page of a listing, keyset pages included, reports the total,
+        so it is counted once per filter set rather than per page.
+        """
+        cache_key: str = self.count_cache_key(filters)
+        total: int | None = await self.cache.get(cache_key)
+        if total is None:
+            total = await self.uow.reception_point.count(filters=filters)
+            await self.cache.set(
+                cache_key, total, tags=[self.CACHE_TAG, WasteService.CACHE_TAG]
+            )
+        return total
+
+    async def get_nearby_reception_points(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        waste_id: uuid.UUID | None = None,
+        per_page: int = 20,
+        cursor: str | None = None,
+    ) -> tuple[list[tuple[ReceptionPoint, float]], str | None]:
+        """Get reception points within radius meters, nearest first."""
+        after: tuple | None = (
+            decode_cursor(cursor, [float, uuid.UUID]) if cursor is not None else None
+        )
+
         async with self.uow:
             try:
                 options: list = []
@@ -126,17 +268,28 @@ class ReceptionPointService:
                 options.append(selectinload(ReceptionPoint.reception_image))
                 options.append(selectinload(ReceptionPoint.waste))
 
-                points: list[ReceptionPoint] = await self.uow.reception_point.get_all(
-                    filters=filters,
+                points: list[
+                    tuple[ReceptionPoint, float]
+                ] = await self.uow.reception_point.get_nearby(
+                    latitude,
+                    longitude,
+                    radius,
+                    limit=per_page + 1,
+                    waste_id=waste_id,
+                    after=after,
                     options=options,
-                    limit=per_page,
-                    offset=(page - 1) * per_page,
                 )
 
-                return points
+                next_cursor: str | None = None
+                if len(points) > per_page:
+                    points = points[:per_page]
+                    point, distance = points[-1]
+                    next_cursor = encode_cursor(distance, point.id)
+
+                return points, next_cursor
             except Exception as e:
                 raise exc.InternalServerException(
-                    detail=f"Failed to get reception points: {str(e)}"
+                    detail=f"Failed to get nearby reception points: {str(e)}"
                 )
 
     async def get_reception_point_by_id(self, id: uuid.UUID) -> ReceptionPoint | None:
@@ -174,7 +327,11 @@ class ReceptionPointService:
 
                 # Delete main record
                 await self.uow.reception_point.delete(point)
+                await self.uow.table_version.bump(ReceptionPoint.__tablename__)
                 await self.uow.commit()
+                await self.cache.invalidate_tags(
+                    self.cache_key(point.id), self.CACHE_TAG
+                )
 
             except exc.NotFoundException:
                 raise
@@ -184,76 +341,172 @@ class ReceptionPointService:
                     detail=f"Failed to delete reception point: {str(e)}"
                 )
 
-    async def update_status(
-        self,
-        reception_point: ReceptionPoint,
-        status: enums.PointStatus,
-        comment: str,
-        user_id: uuid.UUID,
-    ) -> ReceptionPoint:
-        """Update reception point status with moderation history."""
+    async def update_statuses(
+        self, updates: list[StatusUpdate]
+    ) -> list[StatusUpdateOutcome]:
+        """Moderate many reception points in one transaction.
+
+        Points are updated per distinct status, and the moderation and
+        accrual records are inserted with one statement each. Returns an
+        outcome per update, in order; unknown and repeated points fail
+        without affecting the rest.
+        """
+        accepted: dict[uuid.UUID, StatusUpdate] = {}
+        for update in updates:
+            accepted.setdefault(update.reception_point_id, update)
+
         async with self.uow:
             try:
-                reception_point.status = status
-
-                # Create moderation record
-                moderation = Moderation(
-                    comment=comment,
-                    reception_point_id=reception_point.id,
-                    user_id=user_id,
+                owners: dict[
+                    uuid.UUID, uuid.UUID
+                ] = await self.uow.reception_point.update_statuses(
+                    {
+                        reception_point_id: update.status
+                        for reception_point_id, update in accepted.items()
+                    }
                 )
 
-                # # Create accrual history
-                points = 0 if status == enums.PointStatus.REJECTED else 10
-
-                accrual = AccrualHistory(
-                    points=points,
-                    user_id=user_id,
-                    reward=enums.RewardType.RECYCLE_POINT_ADD,
+                await self.uow.moderation.add_many(
+                    [
+                        {
+                            "comment": accepted[reception_point_id].comment,
+                            "reception_point_id": reception_point_id,
+                            "user_id": user_id,
+                        }
+                        for reception_point_id, user_id in owners.items()
+                    ]
+                )
+                await self.uow.accrual_history.add_many(
+                    [
+                        {
+                            "points": self._moderation_points(
+                                accepted[reception_point_id].status
+                            ),
+                            "user_id": user_id,
+                            "reward": enums.RewardType.RECYCLE_POINT_ADD,
+                        }
+                        for reception_point_id, user_id in owners.items()
+                    ]
                 )
 
-                await self.uow.moderation.add(moderation)
-                await self.uow.accrual_history.add(accrual)
-                await self.uow.reception_point.add(reception_point)
+                if owners:
+                    await self.uow.table_version.bump(ReceptionPoint.__tablename__)
                 await self.uow.commit()
-
-                return reception_point
-
-            except exc.NotFoundException:
-                raise
             except Exception as e:
                 await self.uow.rollback()
                 raise exc.InternalServerException(
-                    detail=f"Failed to update status: {str(e)}"
+                    detail=f"Failed to update statuses: {str(e)}"
                 )
 
+        if owners:
+            await self.cache.invalidate_tags(
+                *(self.cache_key(reception_point_id) for reception_point_id in owners),
+                *(UserService.cache_key(user_id) for user_id in set(owners.values())),
+                self.CACHE_TAG,
+            )
+
+        outcomes: list[StatusUpdateOutcome] = []
+        for update in updates:
+            reception_point_id: uuid.UUID = update.reception_point_id
+            if accepted.get(reception_point_id) is not update:
+                outcomes.append(
+                    StatusUpdateOutcome(
+                        reception_point_id=reception_point_id,
+                        status=enums.Status.FAILURE,
+                        detail="Duplicate reception point in request.",
+                    )
+                )
+            elif reception_point_id not in owners:
+                outcomes.append(
+                    StatusUpdateOutcome(
+                        reception_point_id=reception_point_id,
+                        status=enums.Status.FAILURE,
+                        detail=f"Reception point with {reception_point_id} id not found.",
+                    )
+                )
+            else:
+                outcomes.append(
+                    StatusUpdateOutcome(
+                        reception_point_id=reception_point_id,
+                        status=enums.Status.SUCCESS,
+                    )
+                )
+        return outcomes
+
+    @staticmethod
+    def _moderation_points(status: enums.PointStatus) -> int:
+        """Points credited to the point owner for a moderation decision."""
+        return 0 if status == enums.PointStatus.REJECTED else 10
+
     # Private helper methods
+    def _build_filters(self, filters: dict | None) -> dict:
+        """Translate filter parameters into repository filter keys."""
+        filters = dict(filters or {})
+
+        if filters.pop("open_now", False) and "open_at" not in filters:
+            filters["open_at"] = datetime.now(
+                tz=ZoneInfo(schedule_config.SCHEDULE_TIMEZONE)
+            )
+        if "open_at" in filters:
+            filters["open_at"] = self._minute_of_week(filters["open_at"])
+
+        built: dict = {}
+        for name, value in filters.items():
+            if name not in self.FILTERS:
+                raise exc.BadRequestException(detail=f"Unknown filter: {name}")
+            built[self.FILTERS[name]] = value
+        return built
+
+    def _minute_of_week(self, moment: datetime) -> int:
+        """Minute of week of a moment in the schedule timezone."""
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(ZoneInfo(schedule_config.SCHEDULE_TIMEZONE))
+        return minute_of_week(enums.DayOfWeek(moment.isoweekday()), moment.time())
+
     async def _upload_images(
         self,
         point_id: uuid.UUID,
-        files: list[tuple[str, bytes, str]],
+        files: list[tuple[str, typing.BinaryIO, str]],
         filenames: list[str],
     ) -> list[str]:
-        """Upload images to S3 and return URLs."""
-        urls = []
-        i = 0
-        for _, content, _ in files:
-            try:
-                url = self.s3_storage.upload_object(
+        """Upload images to S3 concurrently and return URLs."""
+        semaphore = asyncio.Semaphore(s3_config.UPLOAD_CONCURRENCY)
+
+        async def upload(content: typing.BinaryIO, filename: str) -> str:
+            async with semaphore:
+                url = await self.s3_storage.upload_object(
                     bucket_name=s3_config.RECEPTION_POINT_BUCKET,
                     prefix=f"{point_id}/images",
-                    source_file_name=filenames[i],
+                    source_file_name=filename,
                     content=content,
                 )
-                urls.append(url.split("?")[0])
-                i += 1
-            except Exception as e:
-                # Cleanup already uploaded files if one fails
-                self._delete_images(point_id)
-                raise exc.InternalServerException(
-                    detail=f"Failed to upload image: {str(e)}"
-                )
-        return urls
+                return url.split("?")[0]
+
+        results: list = await asyncio.gather(
+            *(
+                upload(content, filename)
+                for (_, content, _), filename in zip(files, filenames)
+            ),
+            return_exceptions=True,
+        )
+
+        errors: list[BaseException] = [
+            result for result in results if isinstance(result, BaseException)
+        ]
+        if errors:
+            # Cleanup already uploaded files if one fails
+            uploaded: list[str] = [
+                filename
+                for filename, result in zip(filenames, results)
+                if not isinstance(result, BaseException)
+            ]
+            if uploaded:
+                await self._delete_images(point_id, uploaded)
+            raise exc.InternalServerException(
+                detail=f"Failed to upload image: {str(errors[0])}"
+            )
+
+        return results
 
     async def _delete_images(
         self,
@@ -262,12 +515,11 @@ class ReceptionPointService:
     ) -> None:
         """Delete images from S3."""
         try:
-            for filename in filenames:
-                self.s3_storage.delete_object(
-                    bucket_name=s3_config.RECEPTION_POINT_BUCKET,
-                    prefix=f"{point_id}/images",
-                    source_file_name=filename,
-                )
+            await self.s3_storage.delete_objects(
+                bucket_name=s3_config.RECEPTION_POINT_BUCKET,
+                prefix=f"{point_id}/images",
+                source_file_names=filenames,
+            )
         except Exception as e:
             raise exc.InternalServerException(
                 detail=f"Failed to delete images: {str(e)}"
@@ -0,0 +1,19 @@
+import dataclasses
+
+from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
+from ecos_backend.common import exception as exc
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class TableVersionService:
+    uow: AbstractUnitOfWork
+
+    async def get_versions(self, names: list[str]) -> dict[str, int]:
+        """Get the change counters of the given tables."""
+        async with self.uow:
+            try:
+                return await self.uow.table_version.get_versions(names)
+            except Exception as e:
+                raise exc.InternalServerException(
+                    detail=f"Failed to get table versions: {str(e)}"
+                )
@@ -1,6 +1,7 @@
 import dataclasses
 import hashlib
 import random
+import typing
 import uuid
 
 from sqlalchemy.orm import selectinload
@@ -8,6 +9,7 @@ from sqlalchemy.orm import selectinload
 from keycloak import KeycloakAdmin, KeycloakPostError, KeycloakPutError
 
 from ecos_backend.common import config
+from ecos_backend.common.cache import Cache
 from ecos_backend.common.unit_of_work import AbstractUnitOfWork
 from ecos_backend.common.exception import (
     ConflictException,
@@ -26,9 +28,15 @@ class UserService:
     uow: AbstractUnitOfWork
     admin: KeycloakAdmin
     s3_storage: Boto3DAO
+    cache: Cache
 
     VERIFY_EMAIL_PATH = "/api/v1/users/verify-email/"
 
+    @staticmethod
+    def cache_key(user_id: uuid.UUID | str) -> str:
+        """Cache key of a user profile, also used as its tag."""
+        return f"user:{user_id}"
+
     async def register_user(
         self,
         email: str,
@@ -64,14 +72,16 @@ class UserService:
     async def get_account_information(
         self, user_id: uuid.UUID, *, with_image: bool = True
     ) -> User | None:
-        """Get user account information with optional image."""
+        """Get user account information with optional image.
+
+        The points balance is the materialized User.points_total, so the
+        accrual history is not loaded.
+        """
         async with self.uow:
             options: list = []
             if with_image:
                 options.append(selectinload(User.user_image))
 
-            options.append(selectinload(User.accural_history))
-
             user: User | None = await self.uow.user.get_by_id(
                 id=user_id, options=options
             )
@@ -93,6 +103,7 @@ class UserService:
                 user.email_verified = True
                 await self.uow.user.add(user)
                 await self.uow.commit()
+                await self.cache.invalidate_tags(self.cache_key(user.id))
                 return True
             except Exception as ex:
                 await self.uow.rollback()
@@ -129,7 +140,7 @@ class UserService:
         self,
         user: User,
         *,
-        file: bytes | None = None,
+        file: typing.BinaryIO | None = None,
         file_extension: str | None = None,
     ) -> User:
         """Update user account information."""
@@ -140,7 +151,7 @@ class UserService:
                     filename: str = f"{uuid.uuid4()}.{file_extension}"
 
                     # Upload to S3
-                    self.s3_storage.upload_object(
+                    await self.s3_storage.upload_object(
                         bucket_name=config.s3_config.USER_BUCKET,
                         prefix=f"{user.id}/images/",
                         source_file_name=filename,
@@ -161,6 +172,7 @@ class UserService:
 
             await self.uow.user.add(user)
             await self.uow.commit()
+            await self.cache.invalidate_tags(self.cache_key(user.id))
             return user
 
     async def _create_user_in_keycloak(self, email: str, password: str) -> User:
@@ -1,25 +1,182 @@
 import os
+import json
+import typing
 import uuid
+import asyncio
+import logging
+import contextlib
 import dataclasses
 
 from urllib.parse import urlparse
 
 from ecos_backend.db.models.waste import Waste
 from ecos_backend.common.interfaces.unit_of_work import AbstractUnitOfWork
+from ecos_backend.common.cache import Cache, SingleFlight
 from ecos_backend.common.config import s3_config
 from ecos_backend.common import exception as custom_exceptions
 from ecos_backend.db.s3_storage import Boto3DAO
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class WasteEntry:
+    """Immutable copy of a waste row, safe to share between requests."""
+
+    id: uuid.UUID
+    name: str
+    abbreviated_name: str
+    image_url: str | None
+    description: str
+
+    @classmethod
+    def from_model(cls, waste: Waste) -> "WasteEntry":
+        return cls(
+            id=waste.id,
+            name=waste.name,
+            abbreviated_name=waste.abbreviated_name,
+            image_url=waste.image_url,
+            description=waste.description,
+        )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CatalogSnapshot:
+    version: int
+    entries: tuple[WasteEntry, ...]
+    by_id: dict[uuid.UUID, WasteEntry]
+
+
+class WasteCatalog:
+    """Process-wide, versioned copy of the waste catalog.
+
+    Reads are served from memory without touching the database. Local writes
+    invalidate the copy; writes made by other workers are picked up by a
+    background task polling the Waste table version.
+    """
+
+    def __init__(
+        self,
+        uow_factory: typing.Callable[[], AbstractUnitOfWork],
+        poll_interval: float = 5.0,
+    ) -> None:
+        self._uow_factory: typing.Callable[[], AbstractUnitOfWork] = uow_factory
+        self._poll_interval: float = poll_interval
+        self._snapshot: _CatalogSnapshot | None = None
+        # Bumped by invalidate() so that a load started before a write does
+        # not store the data it read.
+        self._generation: int = 0
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._poll_task: asyncio.Task | None = None
+
+    @property
+    def version(self) -> int | None:
+        snapshot: _CatalogSnapshot | None = self._snapshot
+        return snapshot.version if snapshot is not None else None
+
+    async def start(self) -> None:
+        """Loads the catalog and starts polling for changes."""
+        try:
+            await self._load()
+        except Exception:
+            # Readers load the catalog on demand if it is not available yet.
+            logger.exception("Failed to load the waste catalog")
+        if self._poll_task is None and self._poll_interval > 0:
+            self._poll_task = asyncio.create_task(self._poll())
+
+    async def stop(self) -> None:
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poll_task
+            self._poll_task = None
+
+    def invalidate(self) -> None:
+        """Drops the copy; call after the write has been committed."""
+        self._generation += 1
+        self._snapshot = None
+
+    async def get_version(self) -> int:
+        snapshot: _CatalogSnapshot = await self._get_snapshot()
+        return snapshot.version
+
+    async def get_all(self) -> list[WasteEntry]:
+        snapshot: _CatalogSnapshot = await self._get_snapshot()
+        return list(snapshot.entries)
+
+    async def get_by_id(self, id: uuid.UUID) -> WasteEntry | None:
+        snapshot: _CatalogSnapshot = await self._get_snapshot()
+        return snapshot.by_id.get(id)
+
+    async def _get_snapshot(self) -> _CatalogSnapshot:
+        snapshot: _CatalogSnapshot | None = self._snapshot
+        if snapshot is None:
+            snapshot = await self._load()
+        return snapshot
+
+    async def _load(self) -> _CatalogSnapshot:
+        async with self._lock:
+            # Concurrent readers wait for a single load.
+            if self._snapshot is not None:
+                return self._snapshot
+
+            generation: int = self._generation
+            snapshot: _CatalogSnapshot = await self._fetch()
+            if generation == self._generation:
+                self._snapshot = snapshot
+            return snapshot
+
+    async def _fetch(self) -> _CatalogSnapshot:
+        async with self._uow_factory() as uow:
+            # Read the version first: rows newer than the version only cause
+            # one extra reload, rows older than it would never be refreshed.
+            versions: dict[str, int] = await uow.table_version.get_versions(
+                [Waste.__tablename__]
+            )
+            wastes: list[Waste] = await uow.waste.get_all()
+
+        entries: tuple[WasteEntry, ...] = tuple(
+            WasteEntry.from_model(waste) for waste in wastes
+        )
+        return _CatalogSnapshot(
+            version=versions[Waste.__tablename__],
+            entries=entries,
+            by_id={entry.id: entry for entry in entries},
+        )
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                async with self._uow_factory() as uow:
+                    versions: dict[str, int] = await uow.table_version.get_versions(
+                        [Waste.__tablename__]
+                    )
+                if versions[Waste.__tablename__] != self.version:
+                    self.invalidate()
+                    await self._load()
+            except Exception:
+                logger.exception("Failed to refresh the waste catalog")
+
 
 @dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
 class WasteService:
     uow: AbstractUnitOfWork
     s3_storage: Boto3DAO
+    catalog: WasteCatalog
+    cache: Cache
+    single_flight: SingleFlight
+    # Opens the session of a coalesced query, which outlives the request
+    # that started it.
+    uow_factory: typing.Callable[[], AbstractUnitOfWork]
+
+    # Tag of cached responses that embed waste types.
+    CACHE_TAG: typing.ClassVar[str] = Waste.__tablename__
 
     async def add_waste(
         self,
         waste: Waste,
-        file: bytes | None = None,
+        file: typing.BinaryIO | None = None,
         file_extension: str | None = None,
     ) -> Waste:
         """Add new waste record with optional image."""
@@ -28,7 +185,7 @@ class WasteService:
                 if file and file_extension:
                     filename: str = f"{uuid.uuid4()}.{file_extension}"
                     waste.id = uuid.uuid4()
-                    url = self.s3_storage.upload_object(
+                    url = await self.s3_storage.upload_object(
                         bucket_name=s3_config.WASTE_BUCKET,
                         prefix=f"{waste.id}/image",
                         source_file_name=filename,
@@ -38,7 +195,9 @@ class WasteService:
                     waste.image_url = clean_url
 
                 await self.uow.waste.add(waste)
+                await self.uow.table_version.bump(Waste.__tablename__)
                 await self.uow.commit()
+                self.catalog.invalidate()
                 return waste
             except Exception as e:
                 await self.uow.rollback()
@@ -46,41 +205,67 @@ class WasteService:
                     detail=f"Failed to add waste: {str(e)}"
                 ) from e
 
-    async def get_wastes(self, filters: dict | None = None) -> list[Waste]:
-        """Get list of wastes with their image URLs."""
-        async with self.uow:
+    async def get_wastes(
+        self, filters: dict | None = None
+    ) -> list[WasteEntry] | list[Waste]:
+        """Get list of wastes with their image URLs.
+
+        The unfiltered list is served from the in-memory catalog; concurrent
+        identical filtered queries share one database round-trip.
+        """
+        if not filters:
             try:
-                wastes: list[Waste] = await self.uow.waste.get_all(filters=filters)
-                return wastes
+                return await self.catalog.get_all()
             except Exception as e:
                 raise custom_exceptions.InternalServerException(
                     detail=f"Failed to get wastes: {str(e)}"
                 ) from e
 
-    async def get_waste_by_id(self, id: uuid.UUID) -> Waste | None:
-        """Get single waste by ID with image URL."""
-        async with self.uow:
+        try:
+            return await self.single_flight.do(
+                ("wastes", json.dumps(filters, sort_keys=True, default=str)),
+                lambda: self._get_filtered_wastes(filters),
+            )
+        except TimeoutError as e:
+            raise custom_exceptions.ServiceUnavailableException(
+                detail="Timed out waiting for wastes"
+            ) from e
+
+    async def _get_filtered_wastes(self, filters: dict) -> list[Waste]:
+        async with self.uow_factory() as uow:
             try:
-                waste: Waste | None = await self.uow.waste.get_by_id(id=id)
-                return waste
+                wastes: list[Waste] = await uow.waste.get_all(filters=filters)
+                return wastes
             except Exception as e:
                 raise custom_exceptions.InternalServerException(
-                    detail=f"Failed to get waste: {str(e)}"
+                    detail=f"Failed to get wastes: {str(e)}"
                 ) from e
 
+    async def get_waste_by_id(self, id: uuid.UUID) -> WasteEntry | None:
+        """Get single waste by ID with image URL."""
+        try:
+            return await self.catalog.get_by_id(id)
+        except Exception as e:
+            raise custom_exceptions.InternalServerException(
+                detail=f"Failed to get waste: {str(e)}"
+            ) from e
+
     async def delete_waste(self, id: uuid.UUID) -> None:
         """Delete waste record and associated image."""
         async with self.uow:
             try:
-                waste: Waste | None = await self.get_waste_by_id(id)
+                waste: Waste | None = await self.uow.waste.get_by_id(id=id)
                 if not waste:
                     raise custom_exceptions.NotFoundException(detail="Waste not found")
 
                 if waste.image_url:
-                    self._delete_waste_image(waste)
+                    await self._delete_waste_image(waste)
 
                 await self.uow.waste.delete(waste)
+                await self.uow.table_version.bump(Waste.__tablename__)
                 await self.uow.commit()
+                self.catalog.invalidate()
+                await self.cache.invalidate_tags(self.CACHE_TAG)
             except custom_exceptions.NotFoundException:
                 raise
             except Exception as e:
@@ -89,12 +274,12 @@ class WasteService:
                     detail=f"Failed to delete waste: {str(e)}"
                 ) from e
 
-    def _delete_waste_image(self, waste: Waste) -> None:
+    async def _delete_waste_image(self, waste: Waste) -> None:
         """Delete waste image from storage."""
         try:
             waste_id_str = str(waste.id)
 
-            self.s3_storage.delete_object(
+            await self.s3_storage.delete_object(
                 bucket_name=s3_config.WASTE_BUCKET,
                 prefix=f"{waste_id_str}/image",
                 source_file_name=os.path.basename(urlparse(waste.image_url).path),